@@ -0,0 +1,5 @@
+"""Advent Of Code 2024 solvers, callable in-process as ``solve(text) -> (part1, part2)``."""
+
+from .registry import DAYS, DEFAULT_INPUTS, get_solver, solve
+
+__all__ = ["DAYS", "DEFAULT_INPUTS", "get_solver", "solve"]
@@ -0,0 +1,45 @@
+"""Choosing between pure-Python and NumPy implementations at runtime.
+
+NumPy is optional. ``ADVENT_BACKEND`` (or ``--backend``) picks ``python``,
+``numpy`` or ``auto`` (NumPy when it is installed); solvers with a vectorized
+path ask ``numpy_or_none()`` and fall back to Python when it returns ``None``.
+NumPy is only imported the first time a solver asks, so it never costs
+start-up time for days that don't use it.
+"""
+
+import os
+
+BACKENDS = ("auto", "python", "numpy")
+ENV_VAR = "ADVENT_BACKEND"
+
+_numpy = None
+
+
+def get_backend() -> str:
+    backend = os.environ.get(ENV_VAR, "auto")
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+    return backend
+
+
+def set_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+    # Through the environment so batch workers and subprocesses inherit it.
+    os.environ[ENV_VAR] = backend
+
+
+def numpy_or_none():
+    global _numpy
+    backend = get_backend()
+    if backend == "python":
+        return None
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            if backend == "numpy":
+                raise ImportError("the numpy backend was requested but numpy is not installed")
+            return None
+        _numpy = numpy
+    return _numpy
@@ -0,0 +1,90 @@
+import glob
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from .cache import ResultCache, cached_solve_input
+from .registry import get_solver
+
+
+class BatchResult(NamedTuple):
+    path: Path
+    part1: object = None
+    part2: object = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+
+class SolveTimeout(Exception):
+    pass
+
+
+def expand_inputs(patterns: Iterable[str]) -> list[Path]:
+    """Resolve directories (every file inside, sorted) and glob patterns to input paths."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(p for p in Path(pattern).iterdir() if p.is_file()))
+        elif glob.has_magic(pattern):
+            paths.extend(Path(p) for p in sorted(glob.glob(pattern, recursive=True)))
+        else:
+            paths.append(Path(pattern))
+    return paths
+
+
+def _raise_timeout(signum, frame):
+    raise SolveTimeout
+
+
+def solve_path(
+    day: int, path: Path, timeout: float | None = None, cache: ResultCache | None = None
+) -> BatchResult:
+    # Timeouts use SIGALRM inside the worker so a slow input fails on its own
+    # without taking down the pool; platforms without it run unbounded.
+    use_alarm = (
+        bool(timeout)
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    start = time.perf_counter()
+    try:
+        if use_alarm:
+            previous = signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        part1, part2 = cached_solve_input(day, path, cache)
+        return BatchResult(path, part1, part2, elapsed=time.perf_counter() - start)
+    except SolveTimeout:
+        error = f"timed out after {timeout}s"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return BatchResult(path, error=error, elapsed=time.perf_counter() - start)
+
+
+def _solve_job(job: tuple[int, Path, float | None, ResultCache | None]) -> BatchResult:
+    return solve_path(*job)
+
+
+def run_batch(
+    day: int,
+    paths: Iterable[Path],
+    workers: int | None = None,
+    chunksize: int = 8,
+    timeout: float | None = None,
+    cache: ResultCache | None = None,
+) -> Iterator[BatchResult]:
+    """Solve every path for ``day`` on a process pool, yielding results in input order."""
+    get_solver(day)
+    jobs = [(day, Path(path), timeout, cache) for path in paths]
+    if workers == 1:
+        yield from map(_solve_job, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_solve_job, jobs, chunksize=chunksize)
@@ -0,0 +1,112 @@
+"""Scaling benchmarks over generated inputs, with JSON output that can be diffed."""
+
+import json
+import platform
+import time
+import tracemalloc
+from typing import Iterable
+
+from .backend import numpy_or_none
+from .generators import GENERATORS, generate
+from .registry import get_module, get_solver
+
+
+def clear_memos(module) -> None:
+    """Empty the module's ``functools`` caches so every run starts cold."""
+    for value in vars(module).values():
+        if callable(getattr(value, "cache_clear", None)):
+            value.cache_clear()
+
+
+def bench_one(day: int, size: int, repeat: int = 3, seed: int = 0, memory: bool = True) -> dict:
+    text = generate(day, size, seed)
+    module, solver = get_module(day), get_solver(day)
+    # Import the backend up front so the first timed run doesn't pay for it.
+    numpy_or_none()
+    timings = []
+    for _ in range(repeat):
+        clear_memos(module)
+        start = time.perf_counter()
+        solver(text)
+        timings.append(time.perf_counter() - start)
+    result = {
+        "day": day,
+        "size": size,
+        "unit": GENERATORS[day].unit,
+        "input_bytes": len(text.encode()),
+        "best_seconds": min(timings),
+        "mean_seconds": sum(timings) / len(timings),
+    }
+    if memory:
+        # A separate traced run so tracemalloc overhead doesn't skew the timings.
+        clear_memos(module)
+        tracemalloc.start()
+        try:
+            solver(text)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(
+    days: Iterable[int],
+    sizes: Iterable[int] | None = None,
+    repeat: int = 3,
+    seed: int = 0,
+    memory: bool = True,
+) -> dict:
+    results = []
+    for day in days:
+        for size in sizes or GENERATORS[day].sizes:
+            results.append(bench_one(day, size, repeat=repeat, seed=seed, memory=memory))
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(
+    base: dict, new: dict, threshold: float = 1.2, min_seconds: float = 0.001
+) -> list[dict]:
+    """Pair up matching (day, size) runs and flag those slower than ``threshold`` x base.
+
+    Runs faster than ``min_seconds`` in both reports are too noisy to flag.
+    """
+    base_runs = {(r["day"], r["size"]): r for r in base["results"]}
+    rows = []
+    for run in new["results"]:
+        old = base_runs.get((run["day"], run["size"]))
+        if old is None:
+            continue
+        ratio = run["best_seconds"] / old["best_seconds"] if old["best_seconds"] else 1.0
+        rows.append(
+            {
+                "day": run["day"],
+                "size": run["size"],
+                "base_seconds": old["best_seconds"],
+                "new_seconds": run["best_seconds"],
+                "ratio": ratio,
+                "regression": ratio > threshold
+                and max(old["best_seconds"], run["best_seconds"]) >= min_seconds,
+            }
+        )
+    return rows
+
+
+def format_results(report: dict) -> str:
+    lines = [f"{'day':>4} {'size':>10} {'unit':<16} {'best s':>10} {'peak MiB':>9}"]
+    for r in report["results"]:
+        peak = f"{r['peak_bytes'] / 2**20:9.2f}" if "peak_bytes" in r else f"{'-':>9}"
+        lines.append(
+            f"{r['day']:>4} {r['size']:>10} {r['unit']:<16} {r['best_seconds']:>10.4f} {peak}"
+        )
+    return "\n".join(lines)
+
+
+def load_report(path) -> dict:
+    with open(path) as f:
+        return json.load(f)
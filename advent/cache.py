@@ -0,0 +1,224 @@
+"""On-disk result cache keyed by input content and solver source.
+
+Entries are small JSON files named after ``sha256(fingerprint + input)``; the
+fingerprint hashes the solver's module source and the package modules it
+imports, so editing a day or one of its helpers invalidates its old results.
+Recency is tracked through file mtimes and the oldest entries are evicted
+once the directory grows past ``max_bytes``.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from functools import cache
+from itertools import count
+from io import BufferedIOBase
+
+from .inputs import is_stdin, solve_input, solve_stream
+from .registry import get_solver, module_path
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+READ_CHUNK = 2**20
+
+# next() on a count is atomic under the GIL, so threads never share a temp name.
+_writer_ids = count()
+EVICT_EVERY = 256
+EVICT_TO = 0.9
+
+
+def default_cache_dir() -> str:
+    if "ADVENT_CACHE_DIR" in os.environ:
+        return os.environ["ADVENT_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "advent2024")
+
+
+# Relative imports, including the ones deferred into function bodies.
+LOCAL_IMPORT = re.compile(rb"^[ \t]*from \.(\w+) import", re.MULTILINE)
+
+
+def source_closure(path: str) -> list[str]:
+    """A module's source file plus every package module it imports, transitively."""
+    package = os.path.dirname(path)
+    paths = [path]
+    for current in paths:
+        with open(current, "rb") as f:
+            names = LOCAL_IMPORT.findall(f.read())
+        for name in names:
+            dependency = os.path.join(package, name.decode() + ".py")
+            if dependency not in paths and os.path.exists(dependency):
+                paths.append(dependency)
+    return paths
+
+
+@cache
+def solver_fingerprint(day: int) -> str:
+    # Read from the source files so a cache hit never imports the solver. The
+    # helpers a day imports (grid, backend, wordsearch, ...) shape its answers
+    # too, so their sources are part of the fingerprint.
+    digest = hashlib.sha256()
+    for path in source_closure(module_path(day)):
+        with open(path, "rb") as f:
+            digest.update(os.path.basename(path).encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self, directory: str | os.PathLike | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.directory = os.fspath(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        # Running size of the directory as this instance has seen it; a full
+        # scan only happens when it goes over budget or every EVICT_EVERY
+        # stores, to pick up what other workers wrote.
+        self._estimate: int | None = None
+        self._stores = 0
+
+    def hasher(self, day: int) -> "hashlib._Hash":
+        return hashlib.sha256(f"day{day}:{solver_fingerprint(day)}:".encode())
+
+    def key(self, day: int, data: bytes) -> str:
+        digest = self.hasher(day)
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, day: int, data: bytes) -> tuple | None:
+        return self.lookup(self.key(day, data))
+
+    def put(self, day: int, data: bytes, result: tuple) -> None:
+        self.store(self.key(day, data), result)
+
+    def lookup(self, key: str) -> tuple | None:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                result = tuple(json.load(f))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return result
+
+    def store(self, key: str, result: tuple) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # Write-then-rename so concurrent batch workers never see partial entries.
+        # The temp name is unique per writer, threads of one process included.
+        tmp = os.path.join(self.directory, f"{key}.{os.getpid()}.{next(_writer_ids)}.tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump(list(result), f)
+                size = f.tell()
+            os.replace(tmp, self._path(key))
+        except FileNotFoundError:
+            # A concurrent clear() took the temp file; the result is still
+            # correct, it just isn't cached this time.
+            return
+        self._stores += 1
+        if self._estimate is not None:
+            self._estimate += size
+        if (
+            self._estimate is None
+            or self._estimate > self.max_bytes
+            or self._stores % EVICT_EVERY == 0
+        ):
+            self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Evicted by another worker while we were scanning.
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            self._estimate = total
+            return
+        # Trim below the limit so the next few stores don't each trigger a scan.
+        target = int(self.max_bytes * EVICT_TO)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._estimate = total
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith((".json", ".tmp")):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+        self._estimate = None
+
+
+def cached_solve(day: int, data: bytes, cache: ResultCache | None = None) -> tuple:
+    if cache is not None:
+        result = cache.get(day, data)
+        if result is not None:
+            return result
+    result = get_solver(day)(data.decode())
+    if cache is not None:
+        cache.put(day, data, result)
+    return result
+
+
+class _HashingReader:
+    """Feeds everything read from ``stream`` into ``digest`` on the way through."""
+
+    def __init__(self, stream: BufferedIOBase, digest: "hashlib._Hash"):
+        self.stream = stream
+        self.digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.digest.update(data)
+        return data
+
+    def __iter__(self):
+        for line in self.stream:
+            self.digest.update(line)
+            yield line
+
+
+def cached_solve_input(day: int, source: str | os.PathLike, cache: ResultCache | None = None) -> tuple:
+    """Like ``cached_solve`` but never holds more of the input than the solver needs.
+
+    Files are hashed in chunks before solving; stdin can't be re-read, so it is
+    hashed while the solver streams it and the result is stored afterwards.
+    """
+    if cache is None:
+        return solve_input(day, source)
+    digest = cache.hasher(day)
+    if is_stdin(source):
+        reader = _HashingReader(sys.stdin.buffer, digest)
+        result = solve_stream(day, reader)
+        # Drain anything the solver didn't consume so the key covers the whole input.
+        while reader.read(READ_CHUNK):
+            pass
+        cache.store(digest.hexdigest(), result)
+        return result
+    with open(source, "rb") as f:
+        while chunk := f.read(READ_CHUNK):
+            digest.update(chunk)
+    key = digest.hexdigest()
+    result = cache.lookup(key)
+    if result is None:
+        result = solve_input(day, source)
+        cache.store(key, result)
+    return result
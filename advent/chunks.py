@@ -0,0 +1,45 @@
+"""Splitting large inputs into byte ranges that workers can process independently."""
+
+import os
+
+CHUNK_BYTES = 8 * 2**20
+
+
+def split_ranges(path: str | os.PathLike, parts: int) -> list[tuple[int, int]]:
+    """Cut a file into at most ``parts`` [start, end) ranges ending on newlines.
+
+    Every line lies entirely inside one range, so each worker can parse its
+    slice on its own.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, max(parts, 1)):
+            # Start one byte early so a cut that already sits after a newline stays put.
+            f.seek(max(size * i // parts, bounds[-1] + 1) - 1)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def even_ranges(size: int, parts: int) -> list[tuple[int, int]]:
+    """Cut ``size`` bytes into at most ``parts`` [start, end) ranges, ignoring content."""
+    parts = max(1, min(parts, size))
+    bounds = [size * i // parts for i in range(parts + 1)]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def plan_ranges(
+    path: str | os.PathLike, workers: int, chunk_bytes: int = CHUNK_BYTES
+) -> list[tuple[int, int]]:
+    # At least one range per worker, and none much bigger than chunk_bytes so
+    # a worker never holds a large slice of a huge file in memory.
+    size = os.path.getsize(path)
+    return split_ranges(path, max(workers, -(-size // chunk_bytes)))
+
+
+def read_range(path: str | os.PathLike, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
@@ -0,0 +1,364 @@
+import argparse
+import json
+import os
+import sys
+
+from .backend import BACKENDS, set_backend
+from .cache import ResultCache, cached_solve_input
+from .extsort import DEFAULT_RUN_SIZE
+from .inputs import is_stdin, iter_lines, map_input, open_input, read_input
+from .registry import DAYS, DEFAULT_INPUTS
+
+# batch, bench and profiling pull in multiprocessing, tracemalloc and the
+# input generators, so they're imported by the commands that need them.
+
+
+def parse_day(value: str) -> int:
+    try:
+        day = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid day {value!r}") from None
+    if day not in DAYS:
+        raise argparse.ArgumentTypeError(f"no solver registered for day {day}")
+    return day
+
+
+def parse_target(spec: str) -> tuple[int, str]:
+    day, _, path = spec.partition(":")
+    day = parse_day(day)
+    if not path:
+        return day, DEFAULT_INPUTS[day]
+    return day, path
+
+
+def print_result(day: int, part1, part2) -> None:
+    print(f"The Day{day} Puzzle input # Part 1: {part1}")
+    print(f"The Day{day} Puzzle input # Part 2: {part2}")
+
+
+def apply_backend(args: argparse.Namespace) -> None:
+    if args.backend:
+        set_backend(args.backend)
+
+
+def result_cache(args: argparse.Namespace) -> ResultCache | None:
+    if args.no_cache:
+        return None
+    return ResultCache(args.cache_dir)
+
+
+def run(args: argparse.Namespace) -> int:
+    targets = args.targets or [(day, DEFAULT_INPUTS[day]) for day in DAYS]
+    cache = result_cache(args)
+    instrument = args.timings or args.memory or args.profile
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+    if instrument:
+        from .profiling import format_timings, profile_solve
+    reports = []
+    for n, (day, path) in enumerate(targets):
+        if args.external_sort and day == 1:
+            from .day1 import solve_external
+
+            with open_input(path) as stream:
+                part1, part2 = solve_external(iter_lines(stream), run_size=args.run_size)
+            report = {"day": day, "result": [part1, part2]}
+        elif (args.jobs or args.diagnostics) and day == 2:
+            from .day2 import solve_chunked
+
+            if is_stdin(path):
+                raise SystemExit("error: chunked day 2 needs a file, not stdin")
+            part1, part2 = solve_chunked(path, workers=args.jobs, diagnostics=args.diagnostics)
+            report = {"day": day, "result": [part1, part2]}
+        elif args.jobs and day == 3:
+            from .day3 import solve_parallel
+
+            if is_stdin(path):
+                raise SystemExit("error: parallel day 3 needs a file, not stdin")
+            part1, part2 = solve_parallel(path, workers=args.jobs)
+            report = {"day": day, "result": [part1, part2]}
+        elif args.stats and day == 3:
+            from .day3 import format_stats, scan_stats
+
+            if is_stdin(path):
+                report = scan_stats(sys.stdin.buffer.read())
+            else:
+                with map_input(path) as buf:
+                    report = scan_stats(buf)
+            part1, part2 = report["result"]
+        elif instrument:
+            # Instrumented runs always solve; a cache hit would have nothing to measure.
+            profile_path = os.path.join(args.profile, f"day{day}-{n}.prof") if args.profile else None
+            report = profile_solve(
+                day, read_input(path), memory=args.memory, profile_path=profile_path
+            )
+            part1, part2 = report["result"]
+        else:
+            part1, part2 = cached_solve_input(day, path, cache)
+            report = {"day": day, "result": [part1, part2]}
+        report["input"] = str(path)
+        if args.json:
+            reports.append(report)
+            continue
+        if len(targets) > 1:
+            print(f"== day{day} {path}")
+        print_result(day, part1, part2)
+        if "phases" in report:
+            print(format_timings(report), file=sys.stderr)
+        elif "spans" in report:
+            print(format_stats(report), file=sys.stderr)
+    if args.json:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    from .batch import expand_inputs, run_batch
+
+    paths = expand_inputs(args.inputs)
+    failed = 0
+    for result in run_batch(
+        args.day,
+        paths,
+        workers=args.jobs,
+        chunksize=args.chunksize,
+        timeout=args.timeout,
+        cache=result_cache(args),
+    ):
+        if result.error:
+            failed += 1
+            print(f"{result.path}\tERROR\t{result.error}", flush=True)
+        else:
+            print(f"{result.path}\t{result.part1}\t{result.part2}", flush=True)
+    return 1 if failed else 0
+
+
+def parse_sizes(value: str) -> list[int]:
+    try:
+        return [int(size) for size in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list {value!r}") from None
+
+
+def bench(args: argparse.Namespace) -> int:
+    from . import bench as benchmarks
+
+    days = args.days or sorted(DAYS)
+    report = benchmarks.run_benchmarks(
+        days, sizes=args.sizes, repeat=args.repeat, seed=args.seed, memory=not args.no_memory
+    )
+    print(benchmarks.format_results(report), file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if not args.compare:
+        return 0
+    regressions = 0
+    for row in benchmarks.compare_results(
+        benchmarks.load_report(args.compare), report, args.threshold
+    ):
+        flag = "REGRESSION" if row["regression"] else "ok"
+        regressions += row["regression"]
+        print(
+            f"day{row['day']} size={row['size']}: {row['base_seconds']:.4f}s -> "
+            f"{row['new_seconds']:.4f}s (x{row['ratio']:.2f}) {flag}"
+        )
+    return 1 if regressions else 0
+
+
+def startup(args: argparse.Namespace) -> int:
+    from .startup import IMPORT_BUDGET_MS, check_startup
+
+    budget = args.budget if args.budget is not None else IMPORT_BUDGET_MS
+    over = 0
+    for day, ms, ok in check_startup(args.days, budget_ms=budget, runs=args.runs):
+        label = f"advent.cli + day{day}" if day is not None else "advent.cli"
+        over += not ok
+        print(f"{label}: {ms:.1f} ms (budget {budget:.1f} ms) {'ok' if ok else 'OVER'}")
+    return 1 if over else 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    from .server import default_socket_path, serve as serve_forever
+
+    path = args.socket or default_socket_path()
+    print(f"listening on {path}", file=sys.stderr)
+    serve_forever(path, workers=args.workers, cache=result_cache(args))
+    return 0
+
+
+def wordsearch(args: argparse.Namespace) -> int:
+    from .grid import Grid
+    from .wordsearch import count_words, search_words
+
+    words = list(args.words)
+    if args.dictionary:
+        with open(args.dictionary) as f:
+            words.extend(line.strip() for line in f if line.strip())
+    if not words:
+        raise SystemExit("error: no words given")
+    grid = Grid.parse(read_input(args.grid))
+    if args.coordinates:
+        counts, matches = search_words(grid, words, coordinates=True)
+        for word in counts:
+            for r, c, dr, dc in matches[word]:
+                print(f"{word}\t{r}\t{c}\t{dr}\t{dc}")
+        return 0
+    for word, count in count_words(grid, words).items():
+        print(f"{word}\t{count}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="advent", description="Advent Of Code 2024 runner")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=None,
+        help="python, numpy, or auto to use numpy when installed (default: $ADVENT_BACKEND or auto)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cache_options = argparse.ArgumentParser(add_help=False)
+    cache_options.add_argument(
+        "--no-cache", action="store_true", help="always solve, bypassing the result cache"
+    )
+    cache_options.add_argument(
+        "--cache-dir", default=None, help="result cache location (default: ~/.cache/advent2024)"
+    )
+
+    run_parser = commands.add_parser(
+        "run", parents=[cache_options], help="solve one or more inputs in this process"
+    )
+    run_parser.add_argument(
+        "targets",
+        nargs="*",
+        type=parse_target,
+        metavar="DAY[:PATH]",
+        help="day to solve, optionally with an input path or - for stdin "
+        "(default: every day's checked-in input)",
+    )
+    run_parser.add_argument(
+        "--timings", action="store_true", help="report parse/part1/part2 wall time on stderr"
+    )
+    run_parser.add_argument(
+        "--memory", action="store_true", help="trace per-phase allocations with tracemalloc"
+    )
+    run_parser.add_argument(
+        "--profile", metavar="DIR", help="write a cProfile dump per solve into DIR"
+    )
+    run_parser.add_argument(
+        "--json", action="store_true", help="print results (and any timings) as JSON"
+    )
+    run_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="day 3 only: report instruction counts, enable spans and MB/s on stderr",
+    )
+    run_parser.add_argument(
+        "--external-sort",
+        action="store_true",
+        help="day 1 only: sort the columns on disk for inputs larger than memory",
+    )
+    run_parser.add_argument(
+        "--run-size",
+        type=int,
+        default=DEFAULT_RUN_SIZE,
+        help="values per column held in memory before spilling a sorted run",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="days 2 and 3 only: scan byte ranges of the input on this many processes",
+    )
+    run_parser.add_argument(
+        "--diagnostics",
+        metavar="FILE",
+        help="day 2 only: write per-report verdicts and removed levels to FILE (implies chunked)",
+    )
+    run_parser.set_defaults(func=run)
+
+    batch_parser = commands.add_parser(
+        "batch",
+        parents=[cache_options],
+        help="solve many inputs for one day across a process pool",
+    )
+    batch_parser.add_argument("day", type=parse_day)
+    batch_parser.add_argument(
+        "inputs", nargs="+", metavar="INPUT", help="input files, directories or glob patterns"
+    )
+    batch_parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    batch_parser.add_argument(
+        "--chunksize", type=int, default=8, help="inputs handed to a worker at a time"
+    )
+    batch_parser.add_argument(
+        "--timeout", type=float, default=None, help="per-input time limit in seconds"
+    )
+    batch_parser.set_defaults(func=batch)
+
+    bench_parser = commands.add_parser(
+        "bench", help="time solvers over generated inputs of increasing size"
+    )
+    bench_parser.add_argument("days", nargs="*", type=parse_day, metavar="DAY")
+    bench_parser.add_argument(
+        "--sizes", type=parse_sizes, default=None, help="comma separated sizes (default: per day)"
+    )
+    bench_parser.add_argument("--repeat", type=int, default=3)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass"
+    )
+    bench_parser.add_argument("-o", "--output", help="write the JSON report here")
+    bench_parser.add_argument("--compare", metavar="BASE", help="JSON report to compare against")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=1.2, help="slowdown ratio counted as a regression"
+    )
+    bench_parser.set_defaults(func=bench)
+
+    startup_parser = commands.add_parser(
+        "startup", help="check import time of the runner against its budget"
+    )
+    startup_parser.add_argument("days", nargs="*", type=parse_day, metavar="DAY")
+    startup_parser.add_argument(
+        "--budget", type=float, default=None, metavar="MS", help="default: 50 ms"
+    )
+    startup_parser.add_argument("--runs", type=int, default=5)
+    startup_parser.set_defaults(func=startup)
+
+    serve_parser = commands.add_parser(
+        "serve",
+        parents=[cache_options],
+        help="run a solver daemon answering JSON requests on a Unix socket",
+    )
+    serve_parser.add_argument(
+        "--socket", help="socket path (default: $XDG_RUNTIME_DIR/advent2024-UID.sock)"
+    )
+    serve_parser.add_argument("--workers", type=int, default=4, help="solver threads")
+    serve_parser.set_defaults(func=serve)
+
+    wordsearch_parser = commands.add_parser(
+        "wordsearch", help="count words in a day 4 style grid in all eight directions"
+    )
+    wordsearch_parser.add_argument("grid", metavar="PATH", help="grid file, or - for stdin")
+    wordsearch_parser.add_argument("words", nargs="*", metavar="WORD")
+    wordsearch_parser.add_argument(
+        "-d", "--dictionary", metavar="FILE", help="also search for every word in FILE, one per line"
+    )
+    wordsearch_parser.add_argument(
+        "--coordinates",
+        action="store_true",
+        help="print each match as word, row, col, drow, dcol instead of counts",
+    )
+    wordsearch_parser.set_defaults(func=wordsearch)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    apply_backend(args)
+    return args.func(args)
@@ -0,0 +1,235 @@
+########################################
+# day1 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/1  #
+# dimdung                              #
+########################################
+import tempfile
+import warnings
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import groupby, islice
+
+from .backend import numpy_or_none
+from .extsort import DEFAULT_RUN_SIZE, ExternalSorter
+
+
+# Columns go straight into int64 arrays: 8 bytes a value instead of a boxed
+# int plus a per-line list.
+def parse_lines(lines: Iterable[str]) -> tuple[array, array]:
+    list1, list2 = array("q"), array("q")
+    for line in lines:
+        if line.strip():
+            x1, x2 = line.split()
+            list1.append(int(x1))
+            list2.append(int(x2))
+    return list1, list2
+
+
+# Longer tokens may not fit in an int64, which np.fromstring silently clamps.
+SAFE_DIGITS = 18
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+def token_layout(np, data: bytes) -> tuple:
+    """Start offsets and lengths of the whitespace-separated tokens, and the
+    token count of every non-blank line, vectorized."""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    token = ~np.isin(buf, np.frombuffer(b" \t\r\n\v\f", dtype=np.uint8))
+    edges = np.flatnonzero(np.diff(token, prepend=False, append=False))
+    starts, ends = edges[::2], edges[1::2]
+    lines = np.searchsorted(np.flatnonzero(buf == ord("\n")), starts)
+    counts = np.bincount(lines)
+    return starts, ends - starts, counts[counts > 0]
+
+
+def check_int64(data: bytes, starts, lengths) -> None:
+    # Only the rare long tokens are converted in Python; int() reads them the
+    # way the Python parser would.
+    for start in starts[lengths > SAFE_DIGITS].tolist():
+        value = int(data[start:].split(None, 1)[0])
+        if not INT64_MIN <= value <= INT64_MAX:
+            raise OverflowError("int too big to convert")
+
+
+def parse_numpy(np, text: str | bytes) -> tuple:
+    data = text.encode() if isinstance(text, str) else bytes(text)
+    # np.fromstring reads blank text as a single 0, so it never gets to see it.
+    if not data.strip():
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # fromstring ignores line breaks, so check the shape the Python parser
+    # would enforce: exactly two values on every non-blank line.
+    starts, lengths, per_line = token_layout(np, data)
+    if np.any(per_line != 2):
+        raise ValueError("day1 input must have two columns")
+    check_int64(data, starts, lengths)
+    # One C-level pass over the whole text; NumPy only warns on bad data.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=np.int64, sep=" ")
+        except DeprecationWarning as e:
+            raise ValueError(f"invalid day1 input: {e}") from None
+    if values.size != 2 * per_line.size:
+        raise ValueError("invalid day1 input: not every token is an integer")
+    columns = values.reshape(-1, 2)
+    return np.ascontiguousarray(columns[:, 0]), np.ascontiguousarray(columns[:, 1])
+
+
+def parse_lines_numpy(np, lines: Iterable[str], batch: int = 65536) -> tuple:
+    # Streamed input is bulk-parsed a batch of lines at a time.
+    lines = iter(lines)
+    lefts, rights = [], []
+    while chunk := list(islice(lines, batch)):
+        left, right = parse_numpy(np, "\n".join(chunk))
+        lefts.append(left)
+        rights.append(right)
+    if not lefts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(lefts), np.concatenate(rights)
+
+
+def parse(text: str) -> tuple:
+    np = numpy_or_none()
+    if np is not None:
+        return parse_numpy(np, text)
+    return parse_lines(text.splitlines())
+
+
+def as_int64(np, column):
+    # array("q") shares its buffer with NumPy without a copy.
+    return column if isinstance(column, np.ndarray) else np.frombuffer(column, dtype=np.int64)
+
+
+def part1(lists: tuple) -> int:
+    list1, list2 = lists
+    np = numpy_or_none()
+    if np is not None:
+        sorted1 = np.sort(as_int64(np, list1))
+        sorted2 = np.sort(as_int64(np, list2))
+        return int(np.abs(sorted1 - sorted2).sum())
+    return sum(abs(x1 - x2) for x1, x2 in zip(sorted(list1), sorted(list2)))
+
+
+def part2(lists: tuple) -> int:
+    list1, list2 = lists
+    np = numpy_or_none()
+    if np is not None:
+        left = as_int64(np, list1)
+        right = np.sort(as_int64(np, list2))
+        counts = np.searchsorted(right, left, "right") - np.searchsorted(right, left, "left")
+        return int((left * counts).sum())
+    counts = Counter(list2)
+    return sum(x * counts[x] for x in list1)
+
+
+class IncrementalDay1:
+    """Both location lists kept sorted, with running part 1 and part 2 answers.
+
+    Adding or removing a pair finds its ranks by bisection and only re-pairs
+    the entries between the two ranks: everything below the lower rank and
+    above the higher one keeps its partner. The similarity score is a sum of
+    ``x * left[x] * right[x]`` over values, so it updates in O(1) from the
+    occurrence counts.
+    """
+
+    def __init__(self, pairs: Iterable[tuple[int, int]] = ()):
+        pairs = list(pairs)
+        self.left = array("q", sorted(x for x, _ in pairs))
+        self.right = array("q", sorted(y for _, y in pairs))
+        self.left_counts = Counter(self.left)
+        self.right_counts = Counter(self.right)
+        self.distance = sum(abs(x1 - x2) for x1, x2 in zip(self.left, self.right))
+        self.similarity = sum(x * n * self.right_counts[x] for x, n in self.left_counts.items())
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+    def _span_distance(self, lo: int, hi: int) -> int:
+        left, right = self.left, self.right
+        return sum(abs(left[k] - right[k]) for k in range(lo, hi))
+
+    def add(self, x: int, y: int) -> None:
+        i = bisect_right(self.left, x)
+        j = bisect_right(self.right, y)
+        lo, hi = min(i, j), max(i, j)
+        self.distance -= self._span_distance(lo, hi)
+        self.left.insert(i, x)
+        self.right.insert(j, y)
+        self.distance += self._span_distance(lo, hi + 1)
+
+        self.similarity += x * self.right_counts[x]
+        self.left_counts[x] += 1
+        self.similarity += y * self.left_counts[y]
+        self.right_counts[y] += 1
+
+    def remove(self, x: int, y: int) -> None:
+        if not self.left_counts[x] or not self.right_counts[y]:
+            raise ValueError(f"pair ({x}, {y}) is not in the lists")
+        i = bisect_left(self.left, x)
+        j = bisect_left(self.right, y)
+        lo, hi = min(i, j), max(i, j)
+        self.distance -= self._span_distance(lo, hi + 1)
+        del self.left[i]
+        del self.right[j]
+        self.distance += self._span_distance(lo, hi)
+
+        self.left_counts[x] -= 1
+        self.similarity -= x * self.right_counts[x]
+        self.right_counts[y] -= 1
+        self.similarity -= y * self.left_counts[y]
+
+    @property
+    def answers(self) -> tuple[int, int]:
+        return self.distance, self.similarity
+
+
+def similarity_sorted_day1(left: Iterator[int], right: Iterator[int]) -> int:
+    # Merge-join two ascending streams: each value shared by both lists
+    # contributes value * (count on the left) * (count on the right).
+    total = 0
+    right_groups = groupby(right)
+    rkey, rgroup = next(right_groups, (None, None))
+    for lkey, lgroup in groupby(left):
+        while rkey is not None and rkey < lkey:
+            rkey, rgroup = next(right_groups, (None, None))
+        if rkey is None:
+            break
+        if rkey == lkey:
+            total += lkey * sum(1 for _ in lgroup) * sum(1 for _ in rgroup)
+            rkey, rgroup = next(right_groups, (None, None))
+    return total
+
+
+def solve_external(
+    lines: Iterable[str], run_size: int = DEFAULT_RUN_SIZE, tmpdir: str | None = None
+) -> tuple[int, int]:
+    """Solve inputs larger than memory: columns are external-sorted on disk.
+
+    Only ``run_size`` values per column (plus a read buffer per run) are in
+    memory at once; part 1 and part 2 are each one streaming merge pass.
+    """
+    with tempfile.TemporaryDirectory(prefix="advent-day1-", dir=tmpdir) as work:
+        left = ExternalSorter(work, "left", run_size)
+        right = ExternalSorter(work, "right", run_size)
+        for line in lines:
+            if line.strip():
+                x1, x2 = line.split()
+                left.add(int(x1))
+                right.add(int(x2))
+
+        part1 = sum(abs(x1 - x2) for x1, x2 in zip(left.sorted(), right.sorted()))
+        part2 = similarity_sorted_day1(left.sorted(), right.sorted())
+    return part1, part2
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    np = numpy_or_none()
+    lists = parse_lines_numpy(np, lines) if np is not None else parse_lines(lines)
+    return part1(lists), part2(lists)
+
+
+def solve(text: str) -> tuple[int, int]:
+    lists = parse(text)
+    return part1(lists), part2(lists)
@@ -0,0 +1,55 @@
+########################################
+# Advent Of Code 2024                  #
+# https://adventofcode.com/2024/day/10 #
+# dimdung                              #
+########################################
+from collections import deque
+
+from .grid import Grid
+
+SUMMIT = ord("9")
+
+
+def count_trails_day10(grid: Grid, start: int) -> tuple[int, int]:
+    cells = grid.cells
+    steps = grid.neighbors4
+    queue = deque([start])
+    summits = set()
+    count = 0
+    while queue:
+        i = queue.popleft()
+        height = cells[i]
+        if height == SUMMIT:
+            summits.add(i)
+            count += 1
+            continue
+        for d in steps:
+            if cells[i + d] == height + 1:
+                queue.append(i + d)
+    return len(summits), count
+
+
+def parse(text: str) -> Grid:
+    return Grid.parse(text)
+
+
+def parse_buffer(buf) -> Grid:
+    return Grid.from_buffer(buf)
+
+
+# Each trailhead search yields both answers, so they share a phase.
+def solve_parsed(grid: Grid) -> tuple[int, int]:
+    part1, part2 = 0, 0
+    for start in grid.indices(ord("0")):
+        trails, paths = count_trails_day10(grid, start)
+        part1 += trails
+        part2 += paths
+    return part1, part2
+
+
+def solve(text: str) -> tuple[int, int]:
+    return solve_parsed(parse(text))
+
+
+def solve_buffer(buf) -> tuple[int, int]:
+    return solve_parsed(parse_buffer(buf))
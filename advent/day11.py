@@ -0,0 +1,38 @@
+########################################
+# day11 Advent Of Code 2024            #
+# https://adventofcode.com/2024/day/11 #
+# dimdung                              #
+########################################
+from functools import cache
+
+
+@cache
+def count_stones_day11(val: int, blinks: int) -> int:
+    if blinks == 0:
+        return 1
+    if val == 0:
+        return count_stones_day11(1, blinks - 1)
+    str_val = str(val)
+    len_str_val = len(str_val)
+    if len_str_val % 2 == 0:
+        return count_stones_day11(
+            int(str_val[: len_str_val // 2]), blinks - 1
+        ) + count_stones_day11(int(str_val[len_str_val // 2 :]), blinks - 1)
+    return count_stones_day11(val * 2024, blinks - 1)
+
+
+def parse(text: str) -> list[int]:
+    return list(map(int, text.strip().split(" ")))
+
+
+def part1(stones: list[int]) -> int:
+    return sum(count_stones_day11(s, 25) for s in stones)
+
+
+def part2(stones: list[int]) -> int:
+    return sum(count_stones_day11(s, 75) for s in stones)
+
+
+def solve(text: str) -> tuple[int, int]:
+    stones = parse(text)
+    return part1(stones), part2(stones)
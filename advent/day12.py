@@ -0,0 +1,89 @@
+########################################
+# day12 of Advent Of Code 2024         #
+# https://adventofcode.com/2024/day/12 #
+# dimdung                              #
+########################################
+from array import array
+from collections import deque
+
+from .grid import Grid
+
+
+def perimeter_day12(grid: Grid, labels: array, region: list[int]) -> int:
+    label = labels[region[0]]
+    total = 0
+    for i in region:
+        for d in grid.neighbors4:
+            if labels[i + d] != label:
+                total += 1
+    return total
+
+
+def sides_day12(grid: Grid, labels: array, region: list[int]) -> int:
+    # A polygon has as many sides as corners; count the outer and inner
+    # corners around each plot.
+    label = labels[region[0]]
+    up, right, down, left = grid.neighbors4
+    count = 0
+    for i in region:
+        for a, b in ((up, left), (up, right), (down, right), (down, left)):
+            in_a = labels[i + a] == label
+            in_b = labels[i + b] == label
+            if not in_a and not in_b:
+                count += 1
+            elif in_a and in_b and labels[i + a + b] != label:
+                count += 1
+    return count
+
+
+def find_regions_day12(grid: Grid) -> tuple[array, list[list[int]]]:
+    cells = grid.cells
+    labels = array("l", [-1]) * len(cells)
+    regions = []
+    for start in grid.positions():
+        if labels[start] != -1:
+            continue
+        label = len(regions)
+        plant = cells[start]
+        region = []
+        labels[start] = label
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            region.append(i)
+            for d in grid.neighbors4:
+                if labels[i + d] == -1 and cells[i + d] == plant:
+                    labels[i + d] = label
+                    queue.append(i + d)
+        regions.append(region)
+    return labels, regions
+
+
+def parse(text: str) -> tuple[Grid, array, list[list[int]]]:
+    grid = Grid.parse(text)
+    return (grid, *find_regions_day12(grid))
+
+
+def parse_buffer(buf) -> tuple[Grid, array, list[list[int]]]:
+    grid = Grid.from_buffer(buf)
+    return (grid, *find_regions_day12(grid))
+
+
+def part1(data: tuple[Grid, array, list[list[int]]]) -> int:
+    grid, labels, regions = data
+    return sum(len(r) * perimeter_day12(grid, labels, r) for r in regions)
+
+
+def part2(data: tuple[Grid, array, list[list[int]]]) -> int:
+    grid, labels, regions = data
+    return sum(len(r) * sides_day12(grid, labels, r) for r in regions)
+
+
+def solve(text: str) -> tuple[int, int]:
+    data = parse(text)
+    return part1(data), part2(data)
+
+
+def solve_buffer(buf) -> tuple[int, int]:
+    data = parse_buffer(buf)
+    return part1(data), part2(data)
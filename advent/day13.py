@@ -0,0 +1,53 @@
+########################################
+# day13 of Advent Of Code 2024         #
+# https://adventofcode.com/2024/day/13 #
+# dimdung                              #
+########################################
+import re
+
+Machine = tuple[int, int, int, int, int, int]
+
+
+def parse_puzzle_day13(puzzle: str) -> Machine:
+    a1, a2 = tuple(map(int, re.findall(r"Button A: X\+(\d+), Y\+(\d+)", puzzle)[0]))
+    b1, b2 = tuple(map(int, re.findall(r"Button B: X\+(\d+), Y\+(\d+)", puzzle)[0]))
+    c1, c2 = tuple(map(int, re.findall(r"Prize: X=(\d+), Y=(\d+)", puzzle)[0]))
+    return a1, a2, b1, b2, c1, c2
+
+
+def solve_puzzle_day13(machine: Machine, offset: int = 0) -> tuple[int, int]:
+    a1, a2, b1, b2, c1, c2 = machine
+    c1 += offset
+    c2 += offset
+
+    x = ((c1 * b2) - (b1 * c2)) / ((a1 * b2) - (b1 * a2))
+    y = ((a1 * c2) - (c1 * a2)) / ((a1 * b2) - (b1 * a2))
+
+    if int(x) == x and int(y) == y:
+        return tuple(map(int, (x, y)))
+    return (0, 0)
+
+
+def parse(text: str) -> list[Machine]:
+    return [parse_puzzle_day13(puzzle) for puzzle in text.strip().split("\n\n")]
+
+
+def tokens_day13(machines: list[Machine], offset: int = 0) -> int:
+    total = 0
+    for machine in machines:
+        a, b = solve_puzzle_day13(machine, offset=offset)
+        total += a * 3 + b
+    return total
+
+
+def part1(machines: list[Machine]) -> int:
+    return tokens_day13(machines)
+
+
+def part2(machines: list[Machine]) -> int:
+    return tokens_day13(machines, offset=10000000000000)
+
+
+def solve(text: str) -> tuple[int, int]:
+    machines = parse(text)
+    return part1(machines), part2(machines)
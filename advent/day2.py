@@ -0,0 +1,213 @@
+########################################
+# day2 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/2  #
+# dimdung                              #
+########################################
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
+from itertools import chain, islice
+
+from .backend import numpy_or_none
+
+BATCH_REPORTS = 65536
+
+
+def steps_ok_day2(diffs: list[int], sign: int, start: int) -> bool:
+    for i in range(start, len(diffs)):
+        if not 1 <= diffs[i] * sign <= 3:
+            return False
+    return True
+
+
+def dampened_ok_day2(diffs: list[int], sign: int, bad: int) -> bool:
+    # Only removing one of the two levels around the first bad step can help.
+    # Removing an inner level merges its two neighbouring steps into one;
+    # steps before ``bad`` are already known to be fine.
+    last = len(diffs) - 1
+    if bad == 0:
+        if steps_ok_day2(diffs, sign, 1):
+            return True
+    elif 1 <= (diffs[bad - 1] + diffs[bad]) * sign <= 3 and steps_ok_day2(diffs, sign, bad + 1):
+        return True
+    if bad == last:
+        return True
+    return 1 <= (diffs[bad] + diffs[bad + 1]) * sign <= 3 and steps_ok_day2(diffs, sign, bad + 2)
+
+
+def evaluate_report_day2(nums: list[int]) -> tuple[bool, bool]:
+    """(safe, safe with one level removed) from a single pass over the steps."""
+    diffs = [y - x for x, y in zip(nums, nums[1:])]
+    dampened = False
+    for sign in (1, -1):
+        bad = next((i for i, d in enumerate(diffs) if not 1 <= d * sign <= 3), -1)
+        if bad == -1:
+            return True, True
+        dampened = dampened or dampened_ok_day2(diffs, sign, bad)
+    return False, dampened
+
+
+def report_safe_day2(nums: list[int]) -> bool:
+    return evaluate_report_day2(nums)[0]
+
+
+def check_report_day2(nums: list[int], part1: bool = True) -> bool:
+    safe, dampened = evaluate_report_day2(nums)
+    return safe if part1 else dampened
+
+
+def removal_index_day2(nums: list[int]) -> int:
+    """Level whose removal makes an unsafe report safe, or -1 if there is none (or no need)."""
+    if report_safe_day2(nums):
+        return -1
+    diffs = [y - x for x, y in zip(nums, nums[1:])]
+    for sign in (1, -1):
+        # Unsafe both ways, so each direction has a first bad step.
+        bad = next(i for i, d in enumerate(diffs) if not 1 <= d * sign <= 3)
+        for k in (bad, bad + 1):
+            if report_safe_day2(nums[:k] + nums[k + 1 :]):
+                return k
+    return -1
+
+
+def step_ok_numpy(np, diffs, valid, sign: int):
+    # Padding steps count as fine so they never veto a report.
+    return ((diffs * sign >= 1) & (diffs * sign <= 3)) | ~valid
+
+
+def dampened_numpy(np, diffs, valid, lengths, sign: int):
+    n, width = diffs.shape[0], diffs.shape[1] + 1
+    ok = step_ok_numpy(np, diffs, valid, sign)
+    ones = np.ones((n, 1), dtype=bool)
+    # before[:, j]: steps 0..j-1 all fine; after[:, j]: steps j.. all fine.
+    before = np.logical_and.accumulate(np.hstack([ones, ok]), axis=1)
+    after = np.logical_and.accumulate(np.hstack([ok, ones])[:, ::-1], axis=1)[:, ::-1]
+    rows = np.arange(n)
+
+    first = after[:, 1]
+    last = before[rows, np.maximum(lengths - 2, 0)]
+    # Removing inner level k merges steps k-1 and k into one.
+    merged = diffs[:, :-1] + diffs[:, 1:]
+    merged_ok = (merged * sign >= 1) & (merged * sign <= 3)
+    inner = before[:, : width - 2] & merged_ok & after[:, 2:width]
+    inner &= np.arange(1, width - 1) < (lengths - 1)[:, None]
+    return first | last | inner.any(axis=1)
+
+
+def classify_reports_numpy(np, reports: list[list[int]]):
+    """Per-report (safe, dampened) boolean arrays for a batch of reports.
+
+    Reports are packed into a zero-padded 2-D array; a length mask keeps the
+    padding out of every check.
+    """
+    lengths = np.fromiter(map(len, reports), dtype=np.int64, count=len(reports))
+    width = max(int(lengths.max(initial=0)), 2)
+    levels = np.zeros((len(reports), width), dtype=np.int64)
+    mask = np.arange(width) < lengths[:, None]
+    levels[mask] = np.fromiter(chain.from_iterable(reports), dtype=np.int64, count=int(lengths.sum()))
+
+    diffs = np.diff(levels, axis=1)
+    valid = np.arange(width - 1) < (lengths - 1)[:, None]
+    safe = np.zeros(len(reports), dtype=bool)
+    dampened = np.zeros(len(reports), dtype=bool)
+    for sign in (1, -1):
+        safe |= step_ok_numpy(np, diffs, valid, sign).all(axis=1)
+        dampened |= dampened_numpy(np, diffs, valid, lengths, sign)
+    return safe, safe | dampened
+
+
+def classify_reports_day2(reports: list[list[int]]) -> tuple:
+    np = numpy_or_none()
+    if np is not None:
+        return classify_reports_numpy(np, reports)
+    verdicts = [evaluate_report_day2(nums) for nums in reports]
+    return [safe for safe, _ in verdicts], [dampened for _, dampened in verdicts]
+
+
+def iter_reports_day2(lines: Iterable[str]) -> Iterator[list[int]]:
+    for line in lines:
+        if line.strip():
+            yield list(map(int, line.split()))
+
+
+def parse(text: str) -> list[list[int]]:
+    return list(iter_reports_day2(text.splitlines()))
+
+
+# Both verdicts come out of one evaluation per report, so they share a phase.
+def solve_parsed(reports: Iterable[list[int]]) -> tuple[int, int]:
+    part1, part2 = 0, 0
+    np = numpy_or_none()
+    if np is not None:
+        reports = iter(reports)
+        while batch := list(islice(reports, BATCH_REPORTS)):
+            safe, dampened = classify_reports_numpy(np, batch)
+            part1 += int(safe.sum())
+            part2 += int(dampened.sum())
+        return part1, part2
+    for nums in reports:
+        safe, dampened = evaluate_report_day2(nums)
+        part1 += safe
+        part2 += dampened
+    return part1, part2
+
+
+def diagnose_range_day2(job: tuple[str, int, int]) -> tuple[array, array]:
+    """Verdict and removed-level columns for the reports in one byte range."""
+    from .chunks import read_range
+    from .diagnostics import DAMPENED, SAFE, UNSAFE
+
+    path, start, end = job
+    reports = parse(read_range(path, start, end).decode())
+    safe, dampened = classify_reports_day2(reports)
+    verdicts, removed = array("b"), array("i")
+    for nums, ok, fixed in zip(reports, safe, dampened):
+        if ok:
+            verdicts.append(SAFE)
+            removed.append(-1)
+        elif fixed:
+            verdicts.append(DAMPENED)
+            removed.append(removal_index_day2(nums))
+        else:
+            verdicts.append(UNSAFE)
+            removed.append(-1)
+    return verdicts, removed
+
+
+def solve_chunked(
+    path: str, workers: int | None = None, diagnostics: str | None = None
+) -> tuple[int, int]:
+    """Classify byte ranges of a large file on a process pool.
+
+    Ranges end on newlines so workers parse independently; results come back
+    in input order and are optionally written out as a diagnostics file.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .chunks import plan_ranges
+    from .diagnostics import DAMPENED, SAFE, DiagnosticsWriter
+
+    workers = workers or os.cpu_count() or 1
+    jobs = [(path, start, end) for start, end in plan_ranges(path, workers)]
+    part1, part2 = 0, 0
+    with (
+        open(diagnostics, "wb") if diagnostics else nullcontext() as out,
+        ProcessPoolExecutor(max_workers=workers) as pool,
+    ):
+        writer = DiagnosticsWriter(out) if out else None
+        for verdicts, removed in pool.map(diagnose_range_day2, jobs):
+            safe = verdicts.count(SAFE)
+            part1 += safe
+            part2 += safe + verdicts.count(DAMPENED)
+            if writer:
+                writer.write_group(verdicts, removed)
+    return part1, part2
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    return solve_parsed(iter_reports_day2(lines))
+
+
+def solve(text: str) -> tuple[int, int]:
+    return solve_parsed(parse(text))
@@ -0,0 +1,46 @@
+########################################
+# day22 of Advent Of Code 2024         #
+# https://adventofcode.com/2024/day/22 #
+# dimdung                              #
+########################################
+from collections import defaultdict
+from collections.abc import Iterable
+
+
+def next_num(x: int) -> int:
+    x ^= (x * 64) % 16777216
+    x ^= (x // 32) % 16777216
+    x ^= (x * 2048) % 16777216
+    return x
+
+
+def parse(text: str) -> list[int]:
+    return [int(line) for line in text.split()]
+
+
+# Part 2's price sequences come from the same 2000 secrets as part 1.
+def solve_parsed(numbers: Iterable[int]) -> tuple[int, int]:
+    part1 = 0
+    seq_totals = defaultdict(int)
+    for num in numbers:
+        seen = set()
+        outputs = [(num := next_num(num)) % 10 for _ in range(2000)]
+        part1 += num
+        diffs = [y - x for x, y in zip(outputs, outputs[1:])]
+        for n, *seq in zip(outputs[4:], diffs, diffs[1:], diffs[2:], diffs[3:]):
+            seq = tuple(seq)
+            if seq in seen: continue
+            seen.add(seq)
+            seq_totals[seq] += n
+
+    part2 = seq_totals[max(seq_totals, key=seq_totals.get)]
+    return part1, part2
+
+
+def solve(text: str) -> tuple[int, int]:
+    return solve_parsed(parse(text))
+
+
+# solve_parsed only walks the secrets once, so lines can feed it directly.
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    return solve_parsed(int(line) for line in lines if line.strip())
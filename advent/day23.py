@@ -0,0 +1,61 @@
+########################################
+# day23 of Advent Of Code 2024         #
+# https://adventofcode.com/2024/day/23 #
+# dimdung                              #
+########################################
+from collections import defaultdict
+from collections.abc import Iterable
+
+
+def build_set_day23(
+    conns: dict[str, set[str]], passwords: set[str], conn: str, group: set[str]
+) -> None:
+    password = ','.join(sorted(group))
+    if password in passwords: return
+    passwords.add(password)
+    for neighbor in conns[conn]:
+        if neighbor in group: continue
+        if any(neighbor not in conns[node] for node in group): continue
+        build_set_day23(conns, passwords, neighbor, {*group, neighbor})
+
+
+def parse_lines(lines: Iterable[str]) -> dict[str, set[str]]:
+    conns = defaultdict(set)
+    for l in lines:
+        if l.strip():
+            a, b = l.strip().split('-')
+            conns[a].add(b)
+            conns[b].add(a)
+    return conns
+
+
+def parse(text: str) -> dict[str, set[str]]:
+    return parse_lines(text.splitlines())
+
+
+def part1(conns: dict[str, set[str]]) -> int:
+    triples = set()
+    for conn in conns:
+        for neighbor in conns[conn]:
+            for nn in conns[neighbor]:
+                if conn in conns[nn]:
+                    triples.add(tuple(sorted([conn, neighbor, nn])))
+
+    return len([t for t in triples if any(x.startswith("t") for x in t)])
+
+
+def part2(conns: dict[str, set[str]]) -> str:
+    passwords = set()
+    for conn in conns:
+        build_set_day23(conns, passwords, conn, {conn})
+    return max(passwords, key=len)
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, str]:
+    conns = parse_lines(lines)
+    return part1(conns), part2(conns)
+
+
+def solve(text: str) -> tuple[int, str]:
+    conns = parse(text)
+    return part1(conns), part2(conns)
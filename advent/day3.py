@@ -0,0 +1,324 @@
+########################################
+# day3 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/3  #
+# dimdung                              #
+########################################
+
+import os
+import re
+import time
+from collections import namedtuple
+from collections.abc import Iterable
+from functools import reduce
+
+from .vm import InstructionSet, Machine
+
+
+# Groups: the two mul operands, and "n't" for don't(); do() matches none.
+INSTRUCTION = r"mul\((\d{1,3}),(\d{1,3})\)|do(n't)?\(\)"
+INSTRUCTION_BYTES = re.compile(INSTRUCTION.encode())
+LONGEST = len("mul(999,999)")
+
+
+# Instructions are (x, y, negation) group tuples: empty operands mean a
+# do() or don't(), told apart by the negation group.
+def parse(text: str) -> list[tuple[str, str, str]]:
+    return re.findall(INSTRUCTION, text)
+
+
+# The regex runs over the mapped bytes directly; only groups are copied out.
+def parse_buffer(buf) -> list[tuple[bytes, bytes, bytes]]:
+    return INSTRUCTION_BYTES.findall(buf)
+
+
+def run_day3(instructions: list[tuple], conditional: bool) -> int:
+    total = 0
+    enabled = True
+    for x, y, negated in instructions:
+        if not x:
+            enabled = not negated
+        elif enabled or not conditional:
+            total += int(x) * int(y)
+    return total
+
+
+# Scanner states and the actions at the end of each literal. The literals
+# share the trie below, so "do" is matched once for both do() and don't().
+IDLE, LITERAL, FIRST, SECOND = range(4)
+MUL, DO, DONT = "mul", "do", "dont"
+LITERALS = {b"mul(": MUL, b"do()": DO, b"don't()": DONT}
+COMMA, CLOSE = ord(","), ord(")")
+
+
+def literal_trie(literals: dict[bytes, str]) -> dict:
+    root = {}
+    for literal, action in literals.items():
+        node = root
+        for byte in literal[:-1]:
+            node = node.setdefault(byte, {})
+        node[literal[-1]] = action
+    return root
+
+
+TRIE = literal_trie(LITERALS)
+
+
+class InstructionScanner:
+    """Streaming state machine over corrupted memory fed in arbitrary chunks.
+
+    Only the bytes of a candidate instruction are stepped through one at a
+    time; the gaps between them are skipped with ``bytes.find``. Operands are
+    accumulated as integers, so no match is ever sliced out, and a partial
+    instruction at the end of a chunk resumes with the next one.
+    """
+
+    def __init__(self):
+        self.state = IDLE
+        self.node = TRIE
+        self.x = self.y = self.digits = 0
+        self.enabled = True
+        self.total = 0
+        self.enabled_total = 0
+
+    def feed(self, chunk: bytes) -> None:
+        i, n = 0, len(chunk)
+        # Next candidate start per leading byte; refreshed once passed.
+        starts = dict.fromkeys(TRIE, -1)
+        while i < n:
+            state = self.state
+            if state == IDLE:
+                for lead, at in starts.items():
+                    if at < i:
+                        found = chunk.find(lead, i)
+                        starts[lead] = n if found == -1 else found
+                i = min(starts.values())
+                if i < n:
+                    self.node = TRIE[chunk[i]]
+                    self.state = LITERAL
+                    i += 1
+                continue
+            byte = chunk[i]
+            if state == LITERAL:
+                step = self.node.get(byte)
+                if step is None:
+                    self.state = IDLE
+                    continue
+                i += 1
+                if isinstance(step, dict):
+                    self.node = step
+                elif step is MUL:
+                    self.state, self.x, self.digits = FIRST, 0, 0
+                else:
+                    self.enabled = step is DO
+                    self.state = IDLE
+            elif 48 <= byte <= 57 and self.digits < 3:
+                if state == FIRST:
+                    self.x = self.x * 10 + byte - 48
+                else:
+                    self.y = self.y * 10 + byte - 48
+                self.digits += 1
+                i += 1
+            elif state == FIRST and byte == COMMA and self.digits:
+                self.state, self.y, self.digits = SECOND, 0, 0
+                i += 1
+            elif state == SECOND and byte == CLOSE and self.digits:
+                product = self.x * self.y
+                self.total += product
+                if self.enabled:
+                    self.enabled_total += product
+                self.state = IDLE
+                i += 1
+            else:
+                # The offending byte may itself start an instruction.
+                self.state = IDLE
+
+    def answers(self) -> tuple[int, int]:
+        return self.total, self.enabled_total
+
+
+def part1(instructions: list[tuple]) -> int:
+    return run_day3(instructions, conditional=False)
+
+
+def part2(instructions: list[tuple]) -> int:
+    return run_day3(instructions, conditional=True)
+
+
+def solve(text: str) -> tuple[int, int]:
+    instructions = parse(text)
+    return part1(instructions), part2(instructions)
+
+
+# What a chunk contributes, for either enable state it might be entered in.
+# typing.NamedTuple would add its import to every day 3 run.
+ChunkSummary = namedtuple(
+    "ChunkSummary", "total if_enabled if_disabled toggled final", defaults=(False, True)
+)
+
+
+def combine_summaries(a: ChunkSummary, b: ChunkSummary) -> ChunkSummary:
+    # Associative, so chunks can be summarised independently and folded in order.
+    after_enabled = a.final if a.toggled else True
+    after_disabled = a.final if a.toggled else False
+    return ChunkSummary(
+        a.total + b.total,
+        a.if_enabled + (b.if_enabled if after_enabled else b.if_disabled),
+        a.if_disabled + (b.if_enabled if after_disabled else b.if_disabled),
+        a.toggled or b.toggled,
+        b.final if b.toggled else a.final,
+    )
+
+
+def summarize_range(buf, start: int, end: int) -> ChunkSummary:
+    """Summarise the instructions starting in [start, end).
+
+    Instructions never overlap, so scanning from ``start`` finds the same
+    matches as a scan from the beginning; reading up to LONGEST - 1 bytes past
+    ``end`` completes one that straddles the boundary.
+    """
+    total = head = tail = 0
+    toggled, enabled = False, True
+    for m in INSTRUCTION_BYTES.finditer(buf, start, min(end + LONGEST - 1, len(buf))):
+        if m.start() >= end:
+            break
+        x, y, negated = m.groups()
+        if x is None:
+            toggled, enabled = True, negated is None
+            continue
+        product = int(x) * int(y)
+        total += product
+        if not toggled:
+            head += product
+        elif enabled:
+            tail += product
+    return ChunkSummary(total, head + tail, tail, toggled, enabled)
+
+
+def summarize_job(job: tuple[str, int, int]) -> ChunkSummary:
+    from .inputs import map_input
+
+    path, start, end = job
+    with map_input(path) as buf:
+        return summarize_range(buf, start, end)
+
+
+def solve_parallel(path: str, workers: int | None = None) -> tuple[int, int]:
+    """Summarise byte ranges of a file on a process pool and fold the summaries."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .chunks import CHUNK_BYTES, even_ranges
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    ranges = even_ranges(size, max(workers, -(-size // CHUNK_BYTES)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = pool.map(summarize_job, [(path, start, end) for start, end in ranges])
+        summary = reduce(combine_summaries, summaries, ChunkSummary(0, 0, 0))
+    return summary.total, summary.if_enabled
+
+
+def solve_chunks(chunks: Iterable[bytes]) -> tuple[int, int]:
+    scanner = InstructionScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.answers()
+
+
+def scan_stats(buf) -> dict:
+    """Solve a buffer while counting instructions and enabled/disabled spans.
+
+    A span runs from one state change to the next; do() while enabled (or
+    don't() while disabled) doesn't end it.
+    """
+    start = time.perf_counter()
+    counts = {"mul": 0, "do": 0, "don't": 0}
+    muls = {"enabled": 0, "disabled": 0}
+    spans = {"enabled": [0, 0], "disabled": [0, 0]}
+    total = enabled_total = 0
+    enabled, span_start = True, 0
+    for m in INSTRUCTION_BYTES.finditer(buf):
+        x, y, negated = m.groups()
+        if x is not None:
+            counts["mul"] += 1
+            product = int(x) * int(y)
+            total += product
+            if enabled:
+                enabled_total += product
+            muls["enabled" if enabled else "disabled"] += 1
+            continue
+        counts["do" if negated is None else "don't"] += 1
+        if enabled != (negated is None):
+            span = spans["enabled" if enabled else "disabled"]
+            span[0] += 1
+            span[1] += m.start() - span_start
+            enabled, span_start = negated is None, m.start()
+    span = spans["enabled" if enabled else "disabled"]
+    span[0] += 1
+    span[1] += len(buf) - span_start
+    seconds = time.perf_counter() - start
+    return {
+        "day": 3,
+        "result": [total, enabled_total],
+        "instructions": counts,
+        "muls": muls,
+        "spans": {state: {"count": n, "bytes": size} for state, (n, size) in spans.items()},
+        "bytes": len(buf),
+        "seconds": seconds,
+        "mb_per_s": len(buf) / 1e6 / seconds if seconds else 0.0,
+    }
+
+
+def format_stats(stats: dict) -> str:
+    counts = stats["instructions"]
+    lines = [
+        f"day3: {stats['bytes'] / 1e6:.2f} MB in {stats['seconds'] * 1000:.2f} ms"
+        f" ({stats['mb_per_s']:.1f} MB/s)",
+        "  " + "  ".join(f"{name} {n}" for name, n in counts.items()),
+        f"  mul enabled {stats['muls']['enabled']}  disabled {stats['muls']['disabled']}",
+    ]
+    for state, span in stats["spans"].items():
+        lines.append(f"  {state:<8} spans {span['count']:8d}  bytes {span['bytes']:12d}")
+    return "\n".join(lines)
+
+
+# The same program as a table of opcodes; more can be registered on
+# DAY3_OPCODES.copy() without touching the scanner.
+DAY3_OPCODES = InstructionSet()
+
+
+@DAY3_OPCODES.opcode("mul", 2)
+def mul_day3(vm: Machine, x: int, y: int) -> None:
+    vm.registers["total"] += x * y
+    if vm.flags["enabled"]:
+        vm.registers["enabled"] += x * y
+
+
+@DAY3_OPCODES.opcode("do")
+def do_day3(vm: Machine) -> None:
+    vm.flags["enabled"] = True
+
+
+@DAY3_OPCODES.opcode("don't")
+def dont_day3(vm: Machine) -> None:
+    vm.flags["enabled"] = False
+
+
+def solve_vm(buf, opcodes: InstructionSet = DAY3_OPCODES) -> tuple[int, int]:
+    vm = opcodes.run(buf, Machine({"enabled": True}))
+    return vm.registers["total"], vm.registers["enabled"]
+
+
+# One finditer pass over the mapping gives both answers without a match list.
+def solve_buffer(buf) -> tuple[int, int]:
+    total = enabled_total = 0
+    enabled = True
+    for m in INSTRUCTION_BYTES.finditer(buf):
+        x, y, negated = m.groups()
+        if x is None:
+            enabled = negated is None
+            continue
+        product = int(x) * int(y)
+        total += product
+        if enabled:
+            enabled_total += product
+    return total, enabled_total
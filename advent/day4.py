@@ -0,0 +1,37 @@
+########################################
+# day4 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/4  #
+# dimdung                              #
+########################################
+
+from .grid import Grid
+from .stencil import X_MAS, match_template
+from .wordsearch import search_words
+
+
+def parse(text: str) -> Grid:
+    return Grid.parse(text)
+
+
+def parse_buffer(buf) -> Grid:
+    return Grid.from_buffer(buf)
+
+
+def part1(grid: Grid) -> int:
+    counts, _ = search_words(grid, ["XMAS"])
+    return counts["XMAS"]
+
+
+def part2(grid: Grid) -> int:
+    count, _ = match_template(grid, X_MAS)
+    return count
+
+
+def solve(text: str) -> tuple[int, int]:
+    grid = parse(text)
+    return part1(grid), part2(grid)
+
+
+def solve_buffer(buf) -> tuple[int, int]:
+    grid = parse_buffer(buf)
+    return part1(grid), part2(grid)
@@ -0,0 +1,51 @@
+########################################
+# day5 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/5  #
+# dimdung                              #
+########################################
+
+from collections import defaultdict
+from functools import cmp_to_key
+
+
+def check_job_day5(job: list[int], invalid_map: dict) -> bool:
+    for i in range(len(job)):
+        for j in range(i + 1, len(job)):
+            if invalid_map[(job[i], job[j])]:
+                return False
+    return True
+
+
+def parse(text: str) -> tuple[dict, list[tuple[int, ...]]]:
+    rules, jobs = text.split("\n\n")
+    rules = [tuple(map(int, l.split("|"))) for l in rules.splitlines()]
+    jobs = [tuple(map(int, l.split(","))) for l in jobs.splitlines()]
+
+    invalid_map = defaultdict(bool)
+    for x, y in rules:
+        invalid_map[(y, x)] = True
+    return invalid_map, jobs
+
+
+# Both parts come out of the same valid/invalid split, so they share a phase.
+def solve_parsed(data: tuple[dict, list[tuple[int, ...]]]) -> tuple[int, int]:
+    invalid_map, jobs = data
+
+    def sort_job_day5(a: int, b: int) -> int:
+        if invalid_map[(a, b)]:
+            return 1
+        return -1
+
+    part1 = 0
+    part2 = 0
+    for job in jobs:
+        if check_job_day5(job, invalid_map):
+            part1 += job[len(job) // 2]
+        else:
+            fixed_job = sorted(job, key=cmp_to_key(sort_job_day5))
+            part2 += fixed_job[len(fixed_job) // 2]
+    return part1, part2
+
+
+def solve(text: str) -> tuple[int, int]:
+    return solve_parsed(parse(text))
@@ -0,0 +1,83 @@
+########################################
+# day6 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/6  #
+# dimdung                              #
+########################################
+
+from .grid import PAD, Grid
+
+WALL = ord("#")
+FLOOR = ord(".")
+
+
+def check_for_loop_day6(grid: Grid, start: int) -> bool:
+    cells = grid.cells
+    steps = grid.neighbors4
+    # One flag per (cell, direction) state.
+    visited = bytearray(len(cells) * 4)
+    i, d = start, 0
+
+    while True:
+        state = i * 4 + d
+        if visited[state]:
+            return True
+        visited[state] = 1
+        cell = cells[i + steps[d]]
+        if cell == PAD:
+            return False
+        if cell == WALL:
+            d = (d + 1) % 4
+        else:
+            i += steps[d]
+
+
+def parse(text: str) -> Grid:
+    return Grid.parse(text)
+
+
+def parse_buffer(buf) -> Grid:
+    return Grid.from_buffer(buf)
+
+
+def part1(grid: Grid) -> int:
+    cells = grid.cells
+    steps = grid.neighbors4
+
+    i, d = grid.find(ord("^")), 0
+    visited = grid.new_mask()
+
+    while True:
+        visited[i] = 1
+        cell = cells[i + steps[d]]
+        if cell == PAD:
+            break
+        if cell == WALL:
+            d = (d + 1) % 4
+        else:
+            i += steps[d]
+    return visited.count(1)
+
+
+def part2(grid: Grid) -> int:
+    cells = grid.cells
+    start = grid.find(ord("^"))
+
+    count = 0
+    for i in grid.positions():
+        if cells[i] != FLOOR:
+            continue
+        cells[i] = WALL
+        if check_for_loop_day6(grid, start):
+            count += 1
+        cells[i] = FLOOR
+    return count
+
+
+def solve(text: str) -> tuple[int, int]:
+    grid = parse(text)
+    return part1(grid), part2(grid)
+
+
+def solve_buffer(buf) -> tuple[int, int]:
+    grid = parse_buffer(buf)
+    return part1(grid), part2(grid)
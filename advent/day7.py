@@ -0,0 +1,66 @@
+########################################
+# day7 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/7  #
+# dimdung                              #
+########################################
+from collections.abc import Iterable, Iterator
+
+
+def check_possible_day7(target: int, nums: list[int], part2=False) -> bool:
+    if len(nums) == 1:
+        return target == nums[0]
+    num = nums.pop()
+    if target / num == target // num:
+        if check_possible_day7(target // num, nums[:], part2=part2):
+            return True
+    if target - num >= 0:
+        if check_possible_day7(target - num, nums[:], part2=part2):
+            return True
+    if not part2:
+        return False
+    target_str = str(target)
+    num_str = str(num)
+    if target_str.endswith(num_str) and len(target_str) > len(num_str):
+        new_target = int(target_str[: -len(num_str)])
+        if check_possible_day7(new_target, nums[:], part2=part2):
+            return True
+    return False
+
+
+def iter_equations_day7(lines: Iterable[str]) -> Iterator[tuple[int, list[int]]]:
+    for line in map(str.strip, lines):
+        if line:
+            target = int(line.split(":")[0])
+            nums = list(map(int, line.split(": ")[1].split(" ")))
+            yield target, nums
+
+
+def parse(text: str) -> list[tuple[int, list[int]]]:
+    return list(iter_equations_day7(text.splitlines()))
+
+
+def part1(equations: list[tuple[int, list[int]]]) -> int:
+    return sum(target for target, nums in equations if check_possible_day7(target, nums[:]))
+
+
+def part2(equations: list[tuple[int, list[int]]]) -> int:
+    return sum(
+        target
+        for target, nums in equations
+        if check_possible_day7(target, nums[:], part2=True)
+    )
+
+
+def solve_lines(lines: Iterable[str]) -> tuple[int, int]:
+    part1, part2 = 0, 0
+    for target, nums in iter_equations_day7(lines):
+        if check_possible_day7(target, nums[:]):
+            part1 += target
+        if check_possible_day7(target, nums[:], part2=True):
+            part2 += target
+    return part1, part2
+
+
+def solve(text: str) -> tuple[int, int]:
+    equations = parse(text)
+    return part1(equations), part2(equations)
@@ -0,0 +1,55 @@
+########################################
+# day8 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/8  #
+# dimdung                              #
+########################################
+
+from collections import defaultdict
+from itertools import combinations
+
+from .grid import Grid
+
+
+def parse(text: str) -> tuple[Grid, dict[int, list[tuple[int, int]]]]:
+    grid = Grid.parse(text)
+    antenna = defaultdict(list)
+    for i in grid.positions():
+        if grid[i] != ord("."):
+            antenna[grid[i]].append(grid.coords(i))
+    return grid, antenna
+
+
+def part1(data: tuple[Grid, dict[int, list[tuple[int, int]]]]) -> int:
+    grid, antenna = data
+    antinodes = grid.new_mask()
+    for freq in antenna:
+        for (r1, c1), (r2, c2) in combinations(antenna[freq], 2):
+            for r, c in ((2 * r1 - r2, 2 * c1 - c2), (2 * r2 - r1, 2 * c2 - c1)):
+                if grid.contains(r, c):
+                    antinodes[grid.index(r, c)] = 1
+    return antinodes.count(1)
+
+
+def part2(data: tuple[Grid, dict[int, list[tuple[int, int]]]]) -> int:
+    grid, antenna = data
+    antinodes = grid.new_mask()
+    for freq in antenna:
+        for (r1, c1), (r2, c2) in combinations(antenna[freq], 2):
+            dr = r2 - r1
+            dc = c2 - c1
+            r, c = r1, c1
+            while grid.contains(r, c):
+                antinodes[grid.index(r, c)] = 1
+                r += dr
+                c += dc
+            r, c = r1, c1
+            while grid.contains(r, c):
+                antinodes[grid.index(r, c)] = 1
+                r -= dr
+                c -= dc
+    return antinodes.count(1)
+
+
+def solve(text: str) -> tuple[int, int]:
+    data = parse(text)
+    return part1(data), part2(data)
@@ -0,0 +1,99 @@
+########################################
+# day9 of Advent Of Code 2024          #
+# https://adventofcode.com/2024/day/9  #
+# dimdung                              #
+########################################
+
+
+# Maps ASCII digits to their values so the disk map can stay a bytes object.
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def parse(text: str) -> list[int]:
+    return list(map(int, text.strip()))
+
+
+WHITESPACE = b" \t\r\n\v\f"
+
+
+def parse_buffer(buf) -> bytes:
+    # Strip by moving the slice bounds, so the mapping is copied out once and
+    # that copy is translated into the result.
+    start, end = 0, len(buf)
+    while start < end and buf[start] in WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in WHITESPACE:
+        end -= 1
+    with memoryview(buf) as view:
+        data = view[start:end].tobytes().translate(DIGITS)
+    # Anything but a digit passes through translate() unchanged; parse() would
+    # reject it in int(), so reject it here too.
+    if data and max(data) > 9:
+        raise ValueError("day9 input must be a string of digits")
+    return data
+
+
+def part1(data: list[int] | bytes) -> int:
+    disk = []
+    for i in range(0, len(data), 2):
+        disk.extend(data[i] * [i // 2])
+        if i + 1 < len(data):
+            disk.extend(data[i + 1] * [-1])
+
+    empties = [i for i, val in enumerate(disk) if val == -1]
+    i = 0
+    while True:
+        while disk[-1] == -1:
+            disk.pop()
+        target = empties[i]
+        if target >= len(disk):
+            break
+        disk[target] = disk.pop()
+        i += 1
+
+    return sum(i * val for i, val in enumerate(disk))
+
+
+def part2(data: list[int] | bytes) -> int:
+    files = {}
+    spaces = []
+    ptr = 0
+    for i, size in enumerate(data):
+        if i % 2 == 0:
+            files[i // 2] = (ptr, size)
+        else:
+            spaces.append((ptr, size))
+        ptr += size
+
+    for fid in reversed(files):
+        loc, file_size = files[fid]
+        space_id = 0
+        while space_id < len(spaces):
+            space_loc, space_size = spaces[space_id]
+            if space_loc > loc:
+                break
+            if space_size == file_size:
+                files[fid] = (space_loc, file_size)
+                spaces.pop(space_id)
+                break
+            if space_size > file_size:
+                files[fid] = (space_loc, file_size)
+                spaces[space_id] = (space_loc + file_size, space_size - file_size)
+                break
+            space_id += 1
+
+    checksum = 0
+    for fid, (loc, size) in files.items():
+        for i in range(loc, loc + size):
+            checksum += fid * i
+    return checksum
+
+
+def solve(text: str) -> tuple[int, int]:
+    data = parse(text)
+    return part1(data), part2(data)
+
+
+def solve_buffer(buf) -> tuple[int, int]:
+    data = parse_buffer(buf)
+    return part1(data), part2(data)
@@ -0,0 +1,65 @@
+"""Compact columnar per-report diagnostics for day 2.
+
+The file is a header followed by row groups, one per input chunk::
+
+    b"ADVDIAG2"                        magic
+    <first index: u64> <count: u32>    row group header
+    verdict  int8[count]               UNSAFE, SAFE or DAMPENED
+    removed  int32[count]              level removed to make it safe, or -1
+
+Report indices are consecutive, so a group stores its first index and the
+rest are implied by position. Everything is little-endian.
+"""
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from typing import BinaryIO
+
+MAGIC = b"ADVDIAG2"
+GROUP = struct.Struct("<QI")
+
+UNSAFE, SAFE, DAMPENED = 0, 1, 2
+VERDICTS = {UNSAFE: "unsafe", SAFE: "safe", DAMPENED: "dampened"}
+
+
+def _little_endian(column: array) -> array:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
+
+
+class DiagnosticsWriter:
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.count = 0
+        f.write(MAGIC)
+
+    def write_group(self, verdicts: array, removed: array) -> None:
+        if len(verdicts) != len(removed):
+            raise ValueError("diagnostics columns differ in length")
+        self.f.write(GROUP.pack(self.count, len(verdicts)))
+        _little_endian(verdicts).tofile(self.f)
+        _little_endian(removed).tofile(self.f)
+        self.count += len(verdicts)
+
+
+def iter_groups(f: BinaryIO) -> Iterator[tuple[int, array, array]]:
+    """Yield (first index, verdicts, removed) for each row group."""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a day 2 diagnostics file")
+    while header := f.read(GROUP.size):
+        first, count = GROUP.unpack(header)
+        verdicts, removed = array("b"), array("i")
+        verdicts.fromfile(f, count)
+        removed.fromfile(f, count)
+        yield first, _little_endian(verdicts), _little_endian(removed)
+
+
+def read_diagnostics(path: str) -> Iterator[tuple[int, int, int]]:
+    """Yield (report index, verdict, removed level) rows from a diagnostics file."""
+    with open(path, "rb") as f:
+        for first, verdicts, removed in iter_groups(f):
+            yield from zip(range(first, first + len(verdicts)), verdicts, removed)
@@ -0,0 +1,76 @@
+"""External merge sort of int64 streams that don't fit in memory.
+
+Values are buffered into runs of ``run_size``, each run is sorted and spilled
+to a temporary file as raw int64s (8 bytes a value), and the runs are merged
+back lazily with ``heapq.merge`` reading each file a chunk at a time. No more
+than ``MERGE_FAN_IN`` runs are open at once: beyond that, groups of runs are
+first merged into longer runs on disk.
+"""
+
+import heapq
+import os
+from array import array
+from collections.abc import Iterator
+
+DEFAULT_RUN_SIZE = 2**21
+READ_ITEMS = 8192
+MERGE_FAN_IN = 64
+
+
+def iter_run(path: str, chunk_items: int = READ_ITEMS) -> Iterator[int]:
+    with open(path, "rb") as f:
+        while data := f.read(chunk_items * 8):
+            chunk = array("q")
+            chunk.frombytes(data)
+            yield from chunk
+
+
+class ExternalSorter:
+    def __init__(self, directory: str, name: str, run_size: int = DEFAULT_RUN_SIZE):
+        self.directory = directory
+        self.name = name
+        self.run_size = run_size
+        self.buffer = array("q")
+        self.runs: list[str] = []
+        self.files = 0
+
+    def add(self, value: int) -> None:
+        self.buffer.append(value)
+        if len(self.buffer) >= self.run_size:
+            self.spill()
+
+    def new_run(self) -> str:
+        path = os.path.join(self.directory, f"{self.name}-{self.files}.run")
+        self.files += 1
+        return path
+
+    def spill(self) -> None:
+        if not self.buffer:
+            return
+        path = self.new_run()
+        with open(path, "wb") as f:
+            array("q", sorted(self.buffer)).tofile(f)
+        self.runs.append(path)
+        self.buffer = array("q")
+
+    def merge_runs(self, runs: list[str]) -> str:
+        path = self.new_run()
+        with open(path, "wb") as f:
+            chunk = array("q")
+            for value in heapq.merge(*(iter_run(run) for run in runs)):
+                chunk.append(value)
+                if len(chunk) >= READ_ITEMS:
+                    chunk.tofile(f)
+                    chunk = array("q")
+            chunk.tofile(f)
+        for run in runs:
+            os.remove(run)
+        return path
+
+    def sorted(self) -> Iterator[int]:
+        """Merge every run; can be called again for another pass over the data."""
+        self.spill()
+        while len(self.runs) > MERGE_FAN_IN:
+            groups = [self.runs[i : i + MERGE_FAN_IN] for i in range(0, len(self.runs), MERGE_FAN_IN)]
+            self.runs = [group[0] if len(group) == 1 else self.merge_runs(group) for group in groups]
+        return heapq.merge(*(iter_run(path) for path in self.runs))
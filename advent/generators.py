@@ -0,0 +1,211 @@
+"""Synthetic puzzle inputs for benchmarking, one generator per day.
+
+Every generator takes a ``size`` (the day's natural scale: rows, grid side,
+node count, ...) and a ``random.Random`` so runs are reproducible from a seed.
+"""
+
+import random
+from itertools import combinations
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable, NamedTuple
+
+
+class Generator(NamedTuple):
+    func: Callable[[int, random.Random], str]
+    unit: str
+    sizes: tuple[int, ...]
+
+
+def gen_day1(size: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n" for _ in range(size)
+    )
+
+
+def gen_day2(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        step = rng.choice((-1, 1))
+        nums = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly well-behaved reports with the occasional bad level.
+            delta = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-2, 6)
+            nums.append(nums[-1] + step * delta)
+        lines.append(" ".join(map(str, nums)))
+    return "\n".join(lines) + "\n"
+
+
+def gen_day3(size: int, rng: random.Random) -> str:
+    junk = "!@#$%^&*()[]{}<>,;:'?+-_ mulxdont"
+    parts = []
+    length = 0
+    while length < size:
+        roll = rng.random()
+        if roll < 0.3:
+            part = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.35:
+            part = rng.choice(("do()", "don't()"))
+        else:
+            part = "".join(rng.choice(junk) for _ in range(rng.randint(1, 12)))
+        parts.append(part)
+        length += len(part)
+    return "".join(parts) + "\n"
+
+
+def gen_day4(size: int, rng: random.Random) -> str:
+    return "".join("".join(rng.choices("XMAS", k=size)) + "\n" for _ in range(size))
+
+
+def gen_day5(size: int, rng: random.Random) -> str:
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for a, b in combinations(pages, 2)]
+    rng.shuffle(rules)
+    jobs = []
+    for _ in range(size):
+        job = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            job.sort(key=pages.index)
+        jobs.append(",".join(map(str, job)))
+    return "\n".join(rules) + "\n\n" + "\n".join(jobs) + "\n"
+
+
+def _guard_escapes_day6(grid: list[list[str]], r: int, c: int) -> bool:
+    rows, cols = len(grid), len(grid[0])
+    dr, dc = -1, 0
+    seen = set()
+    while (r, c, dr, dc) not in seen:
+        seen.add((r, c, dr, dc))
+        if not (0 <= r + dr < rows and 0 <= c + dc < cols):
+            return True
+        if grid[r + dr][c + dc] == "#":
+            dc, dr = -dr, dc
+        else:
+            r += dr
+            c += dc
+    return False
+
+
+def gen_day6(size: int, rng: random.Random) -> str:
+    # The part 1 walk has no loop detection, so only emit maps the guard leaves.
+    while True:
+        grid = [["#" if rng.random() < 0.05 else "." for _ in range(size)] for _ in range(size)]
+        r, c = size // 2, size // 2
+        grid[r][c] = "^"
+        if _guard_escapes_day6(grid, r, c):
+            return "".join("".join(row) + "\n" for row in grid)
+
+
+def gen_day7(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 10))]
+        target = nums[0]
+        for num in nums[1:]:
+            op = rng.choice("+*|")
+            if op == "+":
+                target += num
+            elif op == "*":
+                target *= num
+            else:
+                target = int(f"{target}{num}")
+        if rng.random() < 0.3:
+            target += 1
+        lines.append(f"{target}: {' '.join(map(str, nums))}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_day8(size: int, rng: random.Random) -> str:
+    freqs = ascii_lowercase + ascii_uppercase + "0123456789"
+    grid = [["." for _ in range(size)] for _ in range(size)]
+    for _ in range(max(2, size * size // 50)):
+        grid[rng.randrange(size)][rng.randrange(size)] = rng.choice(freqs)
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def gen_day9(size: int, rng: random.Random) -> str:
+    digits = [str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(size)]
+    if size % 2 == 0:
+        digits.append(str(rng.randint(1, 9)))
+    return "".join(digits) + "\n"
+
+
+def gen_day10(size: int, rng: random.Random) -> str:
+    # Random walks from the centre keep enough ascending paths to be interesting.
+    grid = [[rng.randint(0, 9) for _ in range(size)] for _ in range(size)]
+    for _ in range(size):
+        r, c = rng.randrange(size), rng.randrange(size)
+        for height in range(10):
+            grid[r][c] = height
+            dr, dc = rng.choice(((-1, 0), (1, 0), (0, -1), (0, 1)))
+            r, c = min(max(r + dr, 0), size - 1), min(max(c + dc, 0), size - 1)
+    return "".join("".join(map(str, row)) + "\n" for row in grid)
+
+
+def gen_day11(size: int, rng: random.Random) -> str:
+    return " ".join(str(rng.randint(0, 10_000_000)) for _ in range(size)) + "\n"
+
+
+def gen_day12(size: int, rng: random.Random) -> str:
+    grid = [[rng.choice(ascii_uppercase[:6]) for _ in range(size)] for _ in range(size)]
+    # Smear cells into their neighbours so regions are more than single plots.
+    for r in range(size):
+        for c in range(size):
+            if rng.random() < 0.6:
+                grid[r][c] = grid[r - 1][c] if r and rng.random() < 0.5 else grid[r][c - 1]
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def gen_day13(size: int, rng: random.Random) -> str:
+    machines = []
+    for _ in range(size):
+        while True:
+            a1, a2, b1, b2 = (rng.randint(10, 99) for _ in range(4))
+            if a1 * b2 != b1 * a2:
+                break
+        na, nb = rng.randint(1, 100), rng.randint(1, 100)
+        c1, c2 = a1 * na + b1 * nb, a2 * na + b2 * nb
+        if rng.random() < 0.5:
+            c1 += rng.randint(1, 50)
+        machines.append(
+            f"Button A: X+{a1}, Y+{a2}\nButton B: X+{b1}, Y+{b2}\nPrize: X={c1}, Y={c2}"
+        )
+    return "\n\n".join(machines) + "\n"
+
+
+def gen_day22(size: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randint(1, 16777215)}\n" for _ in range(size))
+
+
+def gen_day23(size: int, rng: random.Random) -> str:
+    names = ["".join(p) for p in combinations(ascii_lowercase, 2)]
+    names += [a + a for a in ascii_lowercase]
+    nodes = rng.sample(names, min(size, len(names)))
+    edges = set()
+    for i, node in enumerate(nodes):
+        for other in rng.sample(nodes, min(7, len(nodes))):
+            if other != node:
+                edges.add(tuple(sorted((node, other))))
+    return "".join(f"{a}-{b}\n" for a, b in edges)
+
+
+GENERATORS: dict[int, Generator] = {
+    1: Generator(gen_day1, "lines", (10_000, 100_000, 1_000_000)),
+    2: Generator(gen_day2, "reports", (1_000, 10_000, 100_000)),
+    3: Generator(gen_day3, "bytes", (20_000, 200_000, 2_000_000)),
+    4: Generator(gen_day4, "grid side", (50, 140, 400)),
+    5: Generator(gen_day5, "updates", (200, 2_000, 20_000)),
+    6: Generator(gen_day6, "grid side", (40, 80, 130)),
+    7: Generator(gen_day7, "equations", (500, 2_000, 8_000)),
+    8: Generator(gen_day8, "grid side", (50, 100, 200)),
+    9: Generator(gen_day9, "disk map length", (2_000, 10_000, 20_000)),
+    10: Generator(gen_day10, "grid side", (50, 200, 500)),
+    11: Generator(gen_day11, "stones", (8, 64, 512)),
+    12: Generator(gen_day12, "grid side", (50, 140, 300)),
+    13: Generator(gen_day13, "machines", (300, 3_000, 30_000)),
+    22: Generator(gen_day22, "buyers", (100, 500, 2_000)),
+    23: Generator(gen_day23, "nodes", (50, 150, 350)),
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day].func(size, random.Random(f"{day}:{size}:{seed}"))
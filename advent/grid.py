@@ -0,0 +1,141 @@
+"""Flat, padded character grids shared by the grid-walking days.
+
+Cells live in one ``bytearray`` with a one-cell border of ``PAD`` bytes around
+the puzzle, so a cell is a plain ``int`` index and a neighbour is ``index +
+offset``. Stepping off the puzzle lands on the border instead of wrapping into
+the next row, which lets the solvers drop their ``0 <= r < rows`` checks.
+"""
+
+from typing import Iterator
+
+PAD = 0
+# What bytes.strip() removes, which is what parse() drops around each row.
+WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+class Grid:
+    __slots__ = ("cells", "rows", "cols", "stride", "up", "down", "left", "right")
+
+    def __init__(self, rows: list[bytes]):
+        self._set_shape(len(rows), len(rows[0]) if rows else 0)
+        if any(len(row) != self.cols for row in rows):
+            raise ValueError("grid rows differ in length")
+        border = bytes(self.stride)
+        self.cells = bytearray(border + b"".join(b"\0" + row + b"\0" for row in rows) + border)
+
+    def _set_shape(self, rows: int, cols: int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 2
+        self.up, self.down, self.left, self.right = -self.stride, self.stride, -1, 1
+
+    @classmethod
+    def parse(cls, text: str | bytes) -> "Grid":
+        if isinstance(text, str):
+            text = text.encode()
+        return cls([row for row in (line.strip() for line in text.splitlines()) if row])
+
+    @classmethod
+    def from_buffer(cls, buf) -> "Grid":
+        """Build a grid from raw input bytes (``bytes``, ``bytearray`` or ``mmap``).
+
+        Rows are copied slice by slice out of the buffer using the stride of
+        its first line, so the input is never decoded or split into lines.
+        Anything that isn't laid out at exactly that stride (blank lines,
+        padded or ragged rows) goes through ``parse`` instead, so mapped and
+        piped input always give the same grid.
+        """
+        size = len(buf)
+        while size and buf[size - 1] in WHITESPACE:
+            size -= 1
+        eol = buf.find(b"\n", 0, size)
+        if eol == -1:
+            eol = size
+        crlf = bool(eol) and buf[eol - 1] == ord("\r")
+        cols = eol - 1 if crlf else eol
+        src_stride = eol + 1
+        rows = (size + src_stride - cols) // src_stride if cols else 0
+        if not cls._regular(buf, size, rows, cols, src_stride, crlf):
+            return cls.parse(bytes(buf))
+
+        grid = cls.__new__(cls)
+        grid._set_shape(rows, cols)
+        grid.cells = bytearray((rows + 2) * grid.stride)
+        with memoryview(buf) as view:
+            for r in range(rows):
+                src = r * src_stride
+                dst = (r + 1) * grid.stride + 1
+                grid.cells[dst : dst + cols] = view[src : src + cols]
+        return grid
+
+    @staticmethod
+    def _regular(buf, size: int, rows: int, cols: int, src_stride: int, crlf: bool) -> bool:
+        # Every row must start and end on a non-space byte, hold no line
+        # break, and be followed by the same line ending as the first; the
+        # last row must end the data.
+        if not rows:
+            return size == 0
+        if (rows - 1) * src_stride + cols != size:
+            return False
+        ending = b"\r\n" if crlf else b"\n"
+        for r in range(rows):
+            src = r * src_stride
+            if buf[src] in WHITESPACE or buf[src + cols - 1] in WHITESPACE:
+                return False
+            # splitlines() also breaks on a lone \r.
+            if buf.find(b"\n", src, src + cols) != -1 or buf.find(b"\r", src, src + cols) != -1:
+                return False
+            if r < rows - 1 and buf[src + cols : src_stride * (r + 1)] != ending:
+                return False
+        return True
+
+    @property
+    def neighbors4(self) -> tuple[int, int, int, int]:
+        # Clockwise from up, so turning right is ``(d + 1) % 4``.
+        return (self.up, self.right, self.down, self.left)
+
+    @property
+    def diagonals(self) -> tuple[int, int, int, int]:
+        return (self.up + self.left, self.up + self.right, self.down + self.right, self.down + self.left)
+
+    @property
+    def neighbors8(self) -> tuple[int, ...]:
+        return self.neighbors4 + self.diagonals
+
+    def index(self, r: int, c: int) -> int:
+        return (r + 1) * self.stride + c + 1
+
+    def coords(self, i: int) -> tuple[int, int]:
+        r, c = divmod(i, self.stride)
+        return r - 1, c - 1
+
+    def contains(self, r: int, c: int) -> bool:
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, i: int) -> int:
+        return self.cells[i]
+
+    def __setitem__(self, i: int, value: int) -> None:
+        self.cells[i] = value
+
+    def positions(self) -> Iterator[int]:
+        for r in range(self.rows):
+            start = (r + 1) * self.stride + 1
+            yield from range(start, start + self.cols)
+
+    def find(self, value: int) -> int:
+        return self.cells.index(value)
+
+    def indices(self, value: int) -> Iterator[int]:
+        cells = self.cells
+        i = cells.find(value)
+        while i != -1:
+            yield i
+            i = cells.find(value, i + 1)
+
+    def new_mask(self) -> bytearray:
+        """A zeroed byte per cell (border included) for visited/membership flags."""
+        return bytearray(len(self.cells))
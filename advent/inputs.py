@@ -0,0 +1,80 @@
+"""Opening puzzle inputs from files or stdin and streaming them line by line."""
+
+import mmap
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from io import BufferedIOBase
+
+from .registry import get_module
+
+STDIN = "-"
+READ_CHUNK = 2**20
+
+
+def is_stdin(source: str | os.PathLike) -> bool:
+    return str(source) == STDIN
+
+
+def open_input(source: str | os.PathLike) -> BufferedIOBase:
+    if is_stdin(source):
+        return sys.stdin.buffer
+    return open(source, "rb")
+
+
+def read_input(source: str | os.PathLike) -> str:
+    if is_stdin(source):
+        return sys.stdin.buffer.read().decode()
+    with open(source) as f:
+        return f.read()
+
+
+@contextmanager
+def map_input(path: str | os.PathLike) -> Iterator[mmap.mmap | bytes]:
+    """Map a file read-only; the solver reads the page cache directly."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped.
+            yield b""
+            return
+        with buf:
+            yield buf
+
+
+def iter_lines(stream: Iterable[bytes]) -> Iterator[str]:
+    """Yield the stripped, non-blank lines of a binary stream as they arrive."""
+    for raw in stream:
+        line = raw.strip()
+        if line:
+            yield line.decode()
+
+
+def iter_chunks(stream: BufferedIOBase, size: int = READ_CHUNK) -> Iterator[bytes]:
+    while chunk := stream.read(size):
+        yield chunk
+
+
+def solve_stream(day: int, stream: BufferedIOBase) -> tuple:
+    module = get_module(day)
+    if hasattr(module, "solve_chunks"):
+        return module.solve_chunks(iter_chunks(stream))
+    if hasattr(module, "solve_lines"):
+        return module.solve_lines(iter_lines(stream))
+    return module.solve(stream.read().decode())
+
+
+def solve_input(day: int, source: str | os.PathLike) -> tuple:
+    """Solve a file or stdin, streaming it through the day's line parser when it has one.
+
+    Days with a ``solve_buffer`` get regular files memory-mapped instead.
+    """
+    if not is_stdin(source) and hasattr(get_module(day), "solve_buffer"):
+        with map_input(source) as buf:
+            return get_module(day).solve_buffer(buf)
+    if is_stdin(source):
+        return solve_stream(day, sys.stdin.buffer)
+    with open_input(source) as stream:
+        return solve_stream(day, stream)
@@ -0,0 +1,80 @@
+"""Per-phase instrumentation for a single solve.
+
+Day modules split their work into ``parse(text)`` followed by either
+``part1(data)``/``part2(data)`` or, when both answers fall out of the same
+computation, a single ``solve_parsed(data)``. ``profile_solve`` times each
+phase and can additionally trace allocations and dump a cProfile file.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from .backend import numpy_or_none
+from .registry import get_module
+
+
+def _run_phase(name: str, func: Callable, arg, memory: bool, phases: dict):
+    stats = {}
+    if memory:
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    value = func(arg)
+    stats["seconds"] = time.perf_counter() - start
+    if memory:
+        after = tracemalloc.take_snapshot()
+        diff = after.compare_to(before, "filename")
+        stats["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        stats["net_blocks"] = sum(d.count_diff for d in diff)
+        stats["net_bytes"] = sum(d.size_diff for d in diff)
+    phases[name] = stats
+    return value
+
+
+def profile_solve(
+    day: int, text: str, memory: bool = False, profile_path: Path | str | None = None
+) -> dict:
+    module = get_module(day)
+    # Import the backend now, or the first phase to ask for it pays for the import.
+    numpy_or_none()
+    phases = {}
+    profiler = cProfile.Profile() if profile_path else None
+    if memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        data = _run_phase("parse", module.parse, text, memory, phases)
+        if hasattr(module, "solve_parsed"):
+            result = _run_phase("parts", module.solve_parsed, data, memory, phases)
+        else:
+            result = (
+                _run_phase("part1", module.part1, data, memory, phases),
+                _run_phase("part2", module.part2, data, memory, phases),
+            )
+    finally:
+        if profiler:
+            profiler.disable()
+        if memory:
+            tracemalloc.stop()
+    if profiler:
+        profiler.dump_stats(profile_path)
+    # Summed per phase so snapshot overhead in memory mode isn't counted.
+    total = sum(stats["seconds"] for stats in phases.values())
+    report = {"day": day, "result": list(result), "total_seconds": total, "phases": phases}
+    if profile_path:
+        report["profile"] = str(profile_path)
+    return report
+
+
+def format_timings(report: dict) -> str:
+    lines = [f"day{report['day']}: {report['total_seconds'] * 1000:.2f} ms"]
+    for name, stats in report["phases"].items():
+        line = f"  {name:<6} {stats['seconds'] * 1000:10.2f} ms"
+        if "peak_bytes" in stats:
+            line += f"  peak {stats['peak_bytes'] / 2**20:8.2f} MiB  blocks {stats['net_blocks']:+d}"
+        lines.append(line)
+    return "\n".join(lines)
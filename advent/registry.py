@@ -0,0 +1,60 @@
+import importlib
+import importlib.util
+import os
+from collections.abc import Callable
+from types import ModuleType
+
+# Kept free of pathlib and typing: this module is on every command's startup path.
+
+Solver = Callable[[str], tuple]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Day modules are imported on first use, so running one day never pays for
+# another day's imports.
+DAYS: dict[int, str] = {
+    day: f"{__package__}.day{day}" for day in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 22, 23)
+}
+
+# The checked-in puzzle inputs don't follow a single naming scheme.
+DEFAULT_INPUTS: dict[int, str] = {
+    1: os.path.join(ROOT, "day1", "day1_input.txt"),
+    2: os.path.join(ROOT, "day2", "day2_input.txt"),
+    3: os.path.join(ROOT, "day3", "day3_input.txt"),
+    4: os.path.join(ROOT, "day4", "day5_input.txt"),
+    5: os.path.join(ROOT, "day5", "day5_input.txt"),
+    6: os.path.join(ROOT, "day6", "day6_input.txt"),
+    7: os.path.join(ROOT, "day7", "day_input.txt"),
+    8: os.path.join(ROOT, "day8", "day8_input.txt"),
+    9: os.path.join(ROOT, "day9", "day9_input.txt"),
+    10: os.path.join(ROOT, "day10", "day10_input.txt"),
+    11: os.path.join(ROOT, "day11", "day11_input.txt"),
+    12: os.path.join(ROOT, "day12", "day12_input.txt"),
+    13: os.path.join(ROOT, "day13", "day13_input.txt"),
+    22: os.path.join(ROOT, "day22", "day22_input.txt"),
+    23: os.path.join(ROOT, "day23", "day23_input.txt"),
+}
+
+
+def module_name(day: int) -> str:
+    try:
+        return DAYS[day]
+    except KeyError:
+        raise ValueError(f"no solver registered for day {day}") from None
+
+
+def get_module(day: int) -> ModuleType:
+    return importlib.import_module(module_name(day))
+
+
+def get_solver(day: int) -> Solver:
+    return get_module(day).solve
+
+
+def module_path(day: int) -> str:
+    """Source file of a day's module, found without importing it."""
+    return importlib.util.find_spec(module_name(day)).origin
+
+
+def solve(day: int, text: str) -> tuple:
+    return get_solver(day)(text)
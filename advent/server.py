@@ -0,0 +1,146 @@
+"""Long-running solver daemon on a Unix socket.
+
+Clients send one JSON object per line, ``{"day": 11, "input": "..."}`` (or an
+absolute ``"path"`` instead of ``"input"``, plus an optional ``"id"`` echoed
+back), and get one JSON line back with ``"result"`` or ``"error"``. Day modules stay
+imported between requests, so memo tables such as day 11's ``@cache`` are
+warm for every request after the first.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import ResultCache, cached_solve, cached_solve_input
+from .registry import DAYS
+
+# Whole puzzle inputs travel on a single line.
+MAX_REQUEST_BYTES = 256 * 2**20
+
+
+def default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime_dir, f"advent2024-{os.getuid()}.sock")
+
+
+def solve_request(request: dict, cache: ResultCache | None) -> tuple:
+    day = request.get("day")
+    # type() rather than isinstance(): true == 1 would pass as day 1.
+    if type(day) is not int or day not in DAYS:
+        raise ValueError(f"no solver registered for day {day!r}")
+    if "input" in request:
+        return cached_solve(day, request["input"].encode(), cache)
+    if "path" in request:
+        path = request["path"]
+        # Relative paths would resolve against the daemon's directory, and
+        # "-" would read the daemon's own stdin.
+        if not isinstance(path, str) or not os.path.isabs(path):
+            raise ValueError(f"'path' must be an absolute file path, not {path!r}")
+        return cached_solve_input(day, path, cache)
+    raise ValueError("request needs an 'input' or a 'path'")
+
+
+class SolverServer:
+    def __init__(self, path: str, workers: int = 4, cache: ResultCache | None = None):
+        self.path = path
+        self.cache = cache
+        # Threads rather than processes: every request shares the same warm
+        # module state, and the event loop stays free to accept clients.
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.requests = 0
+
+    async def handle(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"error": f"invalid JSON: {e}"}
+        if not isinstance(request, dict):
+            return {"error": "request must be a JSON object"}
+        response = {"id": request["id"]} if "id" in request else {}
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(
+                self.executor, solve_request, request, self.cache
+            )
+        except Exception as e:
+            response["error"] = f"{type(e).__name__}: {e}"
+        else:
+            response["day"] = request["day"]
+            response["result"] = list(result)
+        response["seconds"] = time.perf_counter() - start
+        self.requests += 1
+        return response
+
+    async def client_connected(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"error": "request too large"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.handle(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _remove_stale_socket(self) -> None:
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def serve(self) -> None:
+        self._remove_stale_socket()
+        server = await asyncio.start_unix_server(
+            self.client_connected, path=self.path, limit=MAX_REQUEST_BYTES
+        )
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self._remove_stale_socket()
+
+
+def serve(path: str | None = None, workers: int = 4, cache: ResultCache | None = None) -> None:
+    asyncio.run(SolverServer(path or default_socket_path(), workers, cache).serve())
+
+
+def solve_remote(
+    day: int, text: str | None = None, path: str | None = None, socket_path: str | None = None
+) -> tuple:
+    """Blocking client: send one request to a running daemon and return its result."""
+    request = {"day": day}
+    if path is not None:
+        request["path"] = os.path.abspath(path)
+    else:
+        request["input"] = text
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path or default_socket_path())
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            response = json.loads(f.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return tuple(response["result"])
@@ -0,0 +1,62 @@
+"""Startup-time budget for the runner, measured with ``python -X importtime``.
+
+Importing ``advent.cli`` plus one day's module is what every ``run`` pays
+before it reads a byte of input; ``check_startup`` keeps that under budget.
+"""
+
+import os
+import subprocess
+import sys
+
+from .registry import ROOT, module_name
+
+IMPORT_BUDGET_MS = 50.0
+
+
+def import_times(modules: list[str]) -> list[tuple[str, int]]:
+    """Cumulative import time in microseconds of each top-level import made after site."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    code = "; ".join(f"import {name}" for name in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    after_site = False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented under their importer.
+        if name.startswith("  "):
+            continue
+        name = name.strip()
+        if after_site:
+            times.append((name, int(cumulative)))
+        after_site = after_site or name == "site"
+    return times
+
+
+def measure_startup(day: int | None = None, runs: int = 5) -> tuple[float, list[tuple[str, int]]]:
+    """Best-of-``runs`` milliseconds spent importing the runner (and ``day``'s module)."""
+    modules = ["advent.cli"] + ([module_name(day)] if day is not None else [])
+    best = None
+    for _ in range(runs):
+        times = import_times(modules)
+        total = sum(us for _, us in times)
+        if best is None or total < best[0]:
+            best = (total, times)
+    return best[0] / 1000, best[1]
+
+
+def check_startup(
+    days: list[int] | None = None, budget_ms: float = IMPORT_BUDGET_MS, runs: int = 5
+) -> list[tuple[int | None, float, bool]]:
+    results = []
+    for day in days or [None]:
+        ms, _ = measure_startup(day, runs=runs)
+        results.append((day, ms, ms <= budget_ms))
+    return results
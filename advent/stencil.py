@@ -0,0 +1,128 @@
+"""Matching small 2-D templates with wildcards against padded grids.
+
+A template is a sequence of equal-length rows; ``WILDCARD`` cells match
+anything. With ``rotations`` the template is also tried turned by 90, 180 and
+270 degrees (identical rotations only once). Each (position, rotation) that
+matches counts once, and positions are the template's top-left cell.
+"""
+
+from collections.abc import Sequence
+
+from .backend import numpy_or_none
+from .grid import Grid
+from .wordsearch import grid_array
+
+WILDCARD = "."
+
+# Day 4 part 2: two MAS crossing on their A, either way round.
+X_MAS = ("M.S", ".A.", "M.S")
+
+
+def orientations(template: Sequence[str], rotations: bool = True) -> list[tuple[str, ...]]:
+    shapes = [tuple(template)]
+    if len({len(row) for row in shapes[0]}) > 1:
+        raise ValueError("template rows differ in length")
+    if rotations:
+        for _ in range(3):
+            # Clockwise: the old bottom row becomes the new first column.
+            shapes.append(tuple("".join(col) for col in zip(*shapes[-1][::-1])))
+    return list(dict.fromkeys(shapes))
+
+
+def fixed_cells(shape: tuple[str, ...], wildcard: str = WILDCARD) -> list[tuple[int, int, int]]:
+    cells = [
+        (r, c, ord(ch)) for r, row in enumerate(shape) for c, ch in enumerate(row) if ch != wildcard
+    ]
+    if not cells:
+        raise ValueError("template has no fixed cells")
+    return cells
+
+
+def plan_anchors(grid: Grid, shapes: list[tuple[str, ...]]) -> dict[tuple, list[int]]:
+    """Group orientations by the anchor cell the Python matcher searches for.
+
+    Each orientation anchors on its rarest fixed letter, except that the
+    centre of an odd square template stays put when rotated: if it's fixed
+    and no dearer overall, every orientation shares one pass over it.
+    """
+    counts = {}
+
+    def rarity(cell: tuple[int, int, int]) -> int:
+        if cell[2] not in counts:
+            counts[cell[2]] = grid.cells.count(cell[2])
+        return counts[cell[2]]
+
+    rarest = [min(fixed_cells(shape), key=rarity) for shape in shapes]
+    size, mid = len(shapes[0]), len(shapes[0]) // 2
+    if size % 2 and size == len(shapes[0][0]) and shapes[0][mid][mid] != WILDCARD:
+        center = (mid, mid, ord(shapes[0][mid][mid]))
+        if rarity(center) <= sum(map(rarity, rarest)):
+            rarest = [center] * len(shapes)
+    groups = {}
+    for n, (anchor, shape) in enumerate(zip(rarest, shapes)):
+        groups.setdefault((*anchor, len(shape), len(shape[0])), []).append(n)
+    return groups
+
+
+def match_template_python(
+    grid: Grid, template: Sequence[str], rotations: bool = True, coordinates: bool = False
+):
+    cells, stride = grid.cells, grid.stride
+    count, matches = 0, [] if coordinates else None
+    shapes = orientations(template, rotations)
+    for (ar, ac, anchor, height, width), group in plan_anchors(grid, shapes).items():
+        if height > grid.rows or width > grid.cols:
+            continue
+        checks = [
+            (n, [((r - ar) * stride + c - ac, ch) for r, c, ch in fixed_cells(shapes[n])])
+            for n in group
+        ]
+        # Only rows where the whole template fits are searched; columns are
+        # checked per candidate.
+        last_col = grid.cols - width + ac
+        end = grid.index(grid.rows - height + ar, grid.cols)
+        i = cells.find(anchor, grid.index(ar, 0), end)
+        while i != -1:
+            if ac <= i % stride - 1 <= last_col:
+                for n, offsets in checks:
+                    for offset, ch in offsets:
+                        if cells[i + offset] != ch:
+                            break
+                    else:
+                        count += 1
+                        if coordinates:
+                            r, c = grid.coords(i)
+                            matches.append((r - ar, c - ac, n))
+            i = cells.find(anchor, i + 1, end)
+    return count, matches
+
+
+def match_template_numpy(
+    np, grid: Grid, template: Sequence[str], rotations: bool = True, coordinates: bool = False
+):
+    """One boolean AND per fixed template cell over every window position at once."""
+    cells = grid_array(np, grid)
+    count, matches = 0, [] if coordinates else None
+    for n, shape in enumerate(orientations(template, rotations)):
+        fixed = fixed_cells(shape)
+        rows, cols = grid.rows - len(shape) + 1, grid.cols - len(shape[0]) + 1
+        if rows <= 0 or cols <= 0:
+            continue
+        hit = np.ones((rows, cols), dtype=bool)
+        for r, c, ch in fixed:
+            hit &= cells[r : r + rows, c : c + cols] == ch
+        count += int(np.count_nonzero(hit))
+        if coordinates:
+            top, left = np.nonzero(hit)
+            matches.extend((t, l, n) for t, l in zip(top.tolist(), left.tolist()))
+    return count, matches
+
+
+def match_template(
+    grid: Grid, template: Sequence[str], rotations: bool = True, coordinates: bool = False
+):
+    """Count template matches; with ``coordinates`` also list (top, left, rotation) for each."""
+    np = numpy_or_none()
+    if np is not None:
+        return match_template_numpy(np, grid, template, rotations, coordinates)
+    return match_template_python(grid, template, rotations, coordinates)
@@ -0,0 +1,172 @@
+"""Searching padded grids for words in all eight directions.
+
+A match is a start cell plus a direction; a word is counted once per match,
+so a palindrome is found twice (once each way) like any other word read
+backwards. Results are ``(counts, matches)``: ``counts`` maps each word to
+its number of matches and ``matches``, when asked for, maps each word to
+``(row, col, drow, dcol)`` tuples.
+"""
+
+from collections.abc import Iterable
+from itertools import repeat
+
+from .backend import numpy_or_none
+from .grid import PAD, Grid
+
+# Same order as Grid.neighbors8: up, right, down, left, then the diagonals.
+DIRECTIONS8 = ((-1, 0), (0, 1), (1, 0), (0, -1), (-1, -1), (-1, 1), (1, 1), (1, -1))
+
+
+def as_targets(words: Iterable[str | bytes]) -> dict[str | bytes, bytes]:
+    targets = {word: word.encode() if isinstance(word, str) else bytes(word) for word in words}
+    if not all(targets.values()):
+        raise ValueError("cannot search for an empty word")
+    return targets
+
+
+def directions_for(target: bytes) -> tuple[tuple[int, int], ...]:
+    # A single letter reads the same every way; count it once, not eight times.
+    return DIRECTIONS8 if len(target) > 1 else DIRECTIONS8[:1]
+
+
+def grid_array(np, grid: Grid, pad: int = 0):
+    """The puzzle cells as a 2-D uint8 array with ``pad`` rows/cols of PAD around them."""
+    cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.rows + 2, grid.stride)
+    cells = cells[1:-1, 1:-1]
+    return np.pad(cells, pad) if pad else cells
+
+
+def search_words_python(grid: Grid, words: Iterable[str | bytes], coordinates: bool = False):
+    cells = grid.cells
+    stride = grid.stride
+    counts, matches = {}, {} if coordinates else None
+    for word, target in as_targets(words).items():
+        n = len(target)
+        steps = [(dr * stride + dc, dr, dc) for dr, dc in directions_for(target)]
+        found = []
+        second = target[1] if n > 1 else None
+        for i in grid.indices(target[0]):
+            for d, dr, dc in steps:
+                # Most directions fail on the second letter; the rest read the
+                # word with one strided slice. Off-grid steps hit the zero
+                # border (or the end of the buffer) and can't match.
+                if second is not None and cells[i + d] != second:
+                    continue
+                stop = i + n * d
+                if cells[i : stop if stop >= 0 else None : d] == target:
+                    found.append((*grid.coords(i), dr, dc))
+        counts[word] = len(found)
+        if coordinates:
+            matches[word] = found
+    return counts, matches
+
+
+def search_words_numpy(np, grid: Grid, words: Iterable[str | bytes], coordinates: bool = False):
+    """Shifted-array search: one boolean AND per letter and direction over the whole grid."""
+    targets = as_targets(words)
+    pad = max(map(len, targets.values()), default=1) - 1
+    padded = grid_array(np, grid, pad)
+    rows, cols = grid.rows, grid.cols
+    counts, matches = {}, {} if coordinates else None
+    for word, target in targets.items():
+        starts = padded[pad : pad + rows, pad : pad + cols] == target[0]
+        total, found = 0, []
+        for dr, dc in directions_for(target):
+            hit = starts.copy()
+            for k, ch in enumerate(target[1:], 1):
+                r, c = pad + k * dr, pad + k * dc
+                hit &= padded[r : r + rows, c : c + cols] == ch
+            total += int(np.count_nonzero(hit))
+            if coordinates:
+                r, c = np.nonzero(hit)
+                found.extend(zip(r.tolist(), c.tolist(), repeat(dr), repeat(dc)))
+        counts[word] = total
+        if coordinates:
+            matches[word] = found
+    return counts, matches
+
+
+def search_words(grid: Grid, words: Iterable[str | bytes], coordinates: bool = False):
+    np = numpy_or_none()
+    if np is not None:
+        return search_words_numpy(np, grid, words, coordinates)
+    return search_words_python(grid, words, coordinates)
+
+
+class AhoCorasick:
+    """Multi-pattern matcher compiled to a full transition table.
+
+    Bytes outside every pattern (the zero border included) send the scan back
+    to the root, so lines joined with a PAD byte can be scanned as one string.
+    """
+
+    def __init__(self, patterns: list[bytes]):
+        self.patterns = patterns
+        goto: list[dict[int, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for n, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                if ch not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            outputs[state].append(n)
+
+        # Breadth-first, so a state's failure link is finished before its children.
+        self.delta = [dict(goto[0])]
+        self.delta.extend({} for _ in goto[1:])
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            inherited = self.delta[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = inherited.get(ch, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+                queue.append(child)
+            self.delta[state] = {**inherited, **goto[state]}
+        self.outputs = [tuple(out) for out in outputs]
+
+    def count(self, text: bytes) -> list[int]:
+        counts = [0] * len(self.patterns)
+        delta, outputs = self.delta, self.outputs
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            for n in outputs[state]:
+                counts[n] += 1
+        return counts
+
+
+def grid_lines(grid: Grid) -> list[bytes]:
+    """Every row, column, diagonal and anti-diagonal of the grid, read forwards."""
+    cells, stride, rows, cols = grid.cells, grid.stride, grid.rows, grid.cols
+    lines = [bytes(cells[grid.index(r, 0) : grid.index(r, 0) + cols]) for r in range(rows)]
+    lines += [bytes(cells[grid.index(0, c) : grid.index(rows, c) : stride]) for c in range(cols)]
+    for step, corner in ((stride + 1, 0), (stride - 1, cols - 1)):
+        starts = [(0, c) for c in range(cols)] + [(r, corner) for r in range(1, rows)]
+        for r, c in starts:
+            length = min(rows - r, cols - c if step == stride + 1 else c + 1)
+            i = grid.index(r, c)
+            lines.append(bytes(cells[i : i + length * step : step]))
+    return lines
+
+
+def count_words(grid: Grid, words: Iterable[str | bytes]) -> dict[str | bytes, int]:
+    """Count many words at once in a single automaton pass over the grid's lines.
+
+    The lines are joined once, and the joined text reversed covers the other
+    four directions, so the cost is linear in the grid whatever the number of
+    words. Counts agree with ``search_words``.
+    """
+    targets = as_targets(words)
+    counts = {word: grid.cells.count(target) for word, target in targets.items() if len(target) == 1}
+    long_words = [word for word, target in targets.items() if len(target) > 1]
+    if long_words:
+        text = bytes([PAD]).join(grid_lines(grid))
+        automaton = AhoCorasick([targets[word] for word in long_words])
+        forward = automaton.count(text)
+        backward = automaton.count(text[::-1])
+        counts.update(zip(long_words, map(sum, zip(forward, backward))))
+    return {word: counts[word] for word in targets}
@@ -3,28 +3,11 @@
 # https://adventofcode.com/2024/day/3  #
 # dimdung                              #
 ########################################
-
-import re
 import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-with open(sys.argv[1], "r") as f:
-    data = f.read()
-
-part1 = 0
-part2 = 0
-enabled = True
-for inst in re.findall(r"mul\(\d{1,3},\d{1,3}\)|do\(\)|don't\(\)", data):
-    match inst:
-        case "do()":
-            enabled = True
-        case "don't()":
-            enabled = False
-        case _:
-            x, y = map(int, inst[4:-1].split(","))
-            part1 += x * y
-            if enabled:
-                part2 += x * y
+from advent.cli import main
 
-print(f"The Day3 Puzzle input # Part 1: {part1}")
-print(f"The Day3 Puzzle input # Part 2: {part2}")
+sys.exit(main(["run", f"3:{sys.argv[1]}"]))